@@ -9,23 +9,44 @@ from utils.config import BROWSER, BROWSER_PATH, URL
 # Configure logging
 logger = getLogger(__name__)
 
+pytest_plugins = ["utils.impact_analysis", "utils.result_stream", "utils.remote_grid",
+                  "utils.console_capture", "utils.tab_pool", "utils.command_replay", "utils.web_metrics",
+                  "utils.startup_profiler"]
 
-@pytest.fixture(scope='session', params=[BROWSER])
-def start_browser(request):
+
+def _worker_index(config):
     """
-    Fixture to start the specified browser for testing.
+    Return the xdist worker number (0 for gw0, ...) or None when not running distributed.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return None
+    return int(workerinput["workerid"].lstrip("gw"))
+
+
+def _browser_session(name, config, session):
+    """
+    Start the named browser, navigate to the URL and yield it, quitting it afterwards.
 
     Parameters:
-        request (FixtureRequest): Pytest fixture request object.
+        name (str): Lower-case browser name.
+        config (Config): Pytest config object.
+        session (str): Name of the fixture owning the session; recordings are kept per session.
 
     Yields:
         WebDriver: Selenium WebDriver instance for the specified browser.
     """
-    name = request.param.lower()
+    from utils import command_replay, console_capture, web_metrics
+    replay_path = config.getoption("replay_commands")
+    record_path = config.getoption("record_commands")
     driver = None
 
     try:
-        if name == "firefox" or name == "ff":
+        if replay_path:
+            replay_file = command_replay.session_path(replay_path, session)
+            logger.info(f"Replaying WebDriver commands from {replay_file}.")
+            driver = command_replay.ReplayWebDriver(replay_file)
+        elif name == "firefox" or name == "ff":
             logger.info("Starting Firefox browser.")
             driver = webdriver.Firefox()
         elif name == "chrome":
@@ -39,11 +60,21 @@ def start_browser(request):
         elif name == "phantomjs":
             logger.info("Starting PhantomJS browser.")
             driver = webdriver.PhantomJS()
+        elif name == "remote":
+            logger.info("Starting remote browser session.")
+            from utils import remote_grid
+            driver = remote_grid.start_remote_driver(shard_key=_worker_index(config))
         else:
-            raise ValueError(f"Unsupported browser: {name}. Supported options: 'firefox', 'chrome', 'ie', 'phantomjs'.")
+            raise ValueError(f"Unsupported browser: {name}. "
+                             f"Supported options: 'firefox', 'chrome', 'ie', 'phantomjs', 'remote'.")
 
+        if record_path:
+            command_replay.record_commands(driver, command_replay.recording_path(config, record_path, session))
+        if not replay_path:
+            console_capture.start_collector(driver)  # Capture console events off-thread from the first page on
         driver.maximize_window()  # Maximize browser window
         driver.get(URL)  # Navigate to the specified URL
+        web_metrics.record_session_page(driver, "start_page")
 
         yield driver  # Provide the driver instance to the test function
 
@@ -52,9 +83,59 @@ def start_browser(request):
         raise
     finally:
         if driver:
+            console_capture.stop_collector(driver)
             driver.quit()
+            if name == "remote" and not replay_path:
+                from utils import remote_grid
+                remote_grid.get_host_pool().release(driver)
             logger.info(f"Closing the {name} browser")
 
 
+# Not parametrized, so that page_driver can request the same session with getfixturevalue
+@pytest.fixture(scope='session')
+def start_browser(request):
+    """
+    Fixture to start the specified browser for testing.
+
+    Parameters:
+        request (FixtureRequest): Pytest fixture request object.
+
+    Yields:
+        WebDriver: Selenium WebDriver instance for the specified browser.
+    """
+    yield from _browser_session(BROWSER.lower(), request.config, "start_browser")
+
+
+@pytest.fixture
+def page_driver(request):
+    """
+    Fixture providing the driver for page objects.
+
+    Tests marked ``@pytest.mark.browserless(url=...)`` get the HTTP + DOM backend loaded with the given URL
+    (default: the configured URL).  The backend only sees the server-rendered markup: elements rendered by
+    JavaScript are simply missing, so pages that need scripts must be marked ``browserless(url=..., js=True)``
+    to get a real browser.  A real browser is also used when the URL returns an HTTP error or non-HTML content.
+    All other tests get the real browser, which is always the worker's ``start_browser`` session.
+
+    Returns:
+        HttpDriver or WebDriver: The driver to construct page objects with.
+    """
+    marker = request.node.get_closest_marker("browserless")
+    if marker is None:
+        return request.getfixturevalue("start_browser")
 
+    from utils.http_driver import BrowserRequired, HttpDriver
 
+    url = marker.kwargs.get("url", URL)
+    if marker.kwargs.get("js", False):
+        logger.info(f"Using a real browser for {request.node.nodeid}: the page needs JavaScript")
+    else:
+        driver = HttpDriver()
+        try:
+            driver.get(url)
+            return driver
+        except BrowserRequired as e:
+            logger.info(f"Falling back to a real browser for {request.node.nodeid}: {e}")
+    browser = request.getfixturevalue("start_browser")
+    browser.get(url)
+    return browser
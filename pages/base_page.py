@@ -2,6 +2,8 @@ import inspect
 import os
 import sys
 import time
+from urllib.parse import urlencode, urljoin
+
 from utils.logger import get_logger
 
 import pytest
@@ -11,15 +13,86 @@ from selenium.webdriver.support.select import Select
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from utils.config import PAGE_LOAD_TIME, EXPLICIT_WAIT
+from pages.conditions import ALL, ANY, SEQUENCE, wait_for_conditions
+from pages.elements import Element
+from utils.config import PAGE_LOAD_TIME, EXPLICIT_WAIT, URL
 
 
 class BasePage:
+    # Page instances are created on every transition, so they only hold the driver, the timeout and the
+    # elements resolved so far; everything derived from the class is computed once in __init_subclass__.
+    __slots__ = ("_driver", "_time_out", "_elements")
+
+    logger = get_logger(__name__)
+    route = None
+    _element_declarations = {}
+    _ready_conditions = ()
+    _page_url = None
 
     def __init__(self, driver, time_out=PAGE_LOAD_TIME):
         self._driver = driver
         self._time_out = time_out
-        self.logger = get_logger(__name__)
+        self._elements = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        declarations = dict(cls._element_declarations)
+        declarations.update((name, value) for name, value in vars(cls).items() if isinstance(value, Element))
+        cls._element_declarations = declarations
+        # Page methods and the BasePage helpers work with locator tuples, published as "_<name>"
+        for name, element in declarations.items():
+            if f"_{name}" not in vars(cls):
+                setattr(cls, f"_{name}", element.locator)
+        cls._ready_conditions = tuple(element.condition for element in declarations.values() if element.ready)
+        cls._page_url = urljoin(URL, cls.route) if cls.route is not None else None
+
+    @property
+    def driver(self):
+        return self._driver
+
+    @property
+    def timeout(self):
+        return self._time_out
+
+    @classmethod
+    def open(cls, driver, time_out=PAGE_LOAD_TIME, **query):
+        """
+        Navigate to the page's route and return the page once it is ready.
+
+        Args:
+            driver: WebDriver instance.
+            time_out (float): Page timeout (default PAGE_LOAD_TIME).
+            query: Query string parameters, e.g. q="shirt".
+
+        Returns:
+            BasePage: The page object.
+
+        Raises:
+            ValueError: If the page class has no route.
+        """
+        if cls._page_url is None:
+            raise ValueError(f"{cls.__name__} has no route to open")
+        page = cls(driver, time_out)
+        driver.get(f"{cls._page_url}?{urlencode(query)}" if query else cls._page_url)
+        page.wait_until_ready()
+        return page
+
+    def wait_until_ready(self, timeout=None):
+        """
+        Wait until all elements declared with ready=True have reached their state, in one check per poll.
+
+        Returns:
+            WaitResult or None: The wait result, or None if the page declares no readiness elements.
+        """
+        if not self._ready_conditions:
+            return None
+        return self.wait_for_all(*self._ready_conditions, timeout=timeout or self.timeout)
+
+    def reset_elements(self):
+        """
+        Forget the elements resolved so far, e.g. after the page re-rendered them.
+        """
+        self._elements = None
 
     def get_page_title(self):
         """
@@ -45,15 +118,94 @@ class BasePage:
         returns: element
         """
         try:
-            wait = WebDriverWait(self.driver, timeout=timeout, poll_frequency=polling,
-                                 ignored_exceptions=(NoSuchElementException,))
-            element = wait.until(EC.presence_of_element_located(locator))
+            element = self._wait_until(EC.presence_of_element_located(locator), timeout, polling)
             self.logger.info(f"Element found with locator: {locator}")
             return element
         except TimeoutException:
             self.logger.error(f"Element not found within specified timeout with locator: {locator}")
             raise
 
+    def wait_for_elements(self, locator, timeout=EXPLICIT_WAIT, polling=0.5):
+        """
+        Wait for at least one element matching the locator to be present using Fluent Wait.
+
+        Args:
+            locator (tuple): Tuple containing locator strategy and locator value.
+            timeout (int): Maximum time to wait for the elements to be found (default 10 seconds).
+            polling (float): The sleep interval between retries (default 0.5 seconds).
+        returns: list of elements
+        """
+        try:
+            elements = self._wait_until(EC.presence_of_all_elements_located(locator), timeout, polling)
+            self.logger.info(f"{len(elements)} elements found with locator: {locator}")
+            return elements
+        except TimeoutException:
+            self.logger.error(f"No elements found within specified timeout with locator: {locator}")
+            raise
+
+    def _wait_until(self, condition, timeout, polling):
+        # A static (browserless) document never changes, so a single lookup decides; WebDriverWait would
+        # still sleep one polling interval before giving up
+        if getattr(self.driver, "is_static", False):
+            try:
+                result = condition(self.driver)
+            except NoSuchElementException:
+                result = None
+            if not result:
+                raise TimeoutException("Not found in the static document")
+            return result
+        wait = WebDriverWait(self.driver, timeout=timeout, poll_frequency=polling,
+                             ignored_exceptions=(NoSuchElementException,))
+        return wait.until(condition)
+
+    def wait_for_any(self, *conditions, timeout=EXPLICIT_WAIT, polling=0.5):
+        """
+        Wait until any of several conditions is met, evaluating all of them in one check per poll.
+
+        Args:
+            conditions: Condition objects (see pages.conditions) or locator tuples, which mean "present".
+            timeout (int): Maximum time to wait (default 10 seconds).
+            polling (float): The sleep interval between checks (default 0.5 seconds).
+
+        Returns:
+            WaitResult: The index and condition of the first branch that matched, its element and the elapsed time.
+
+        Raises:
+            TimeoutException: If none of the conditions is met within the timeout.
+        """
+        return self._wait_for_conditions(ANY, conditions, timeout, polling)
+
+    def wait_for_all(self, *conditions, timeout=EXPLICIT_WAIT, polling=0.5):
+        """
+        Wait until all conditions are met at the same time, evaluating them in one check per poll.
+
+        Returns:
+            WaitResult: The elements found for every condition and the elapsed time.
+
+        Raises:
+            TimeoutException: If the conditions are not all met within the timeout.
+        """
+        return self._wait_for_conditions(ALL, conditions, timeout, polling)
+
+    def wait_for_sequence(self, *conditions, timeout=EXPLICIT_WAIT, polling=0.5):
+        """
+        Wait until the conditions are met one after the other, in the given order.
+
+        Returns:
+            WaitResult: The elements found for every condition and the elapsed time.
+
+        Raises:
+            TimeoutException: If the sequence does not complete within the timeout.
+        """
+        return self._wait_for_conditions(SEQUENCE, conditions, timeout, polling)
+
+    def _wait_for_conditions(self, mode, conditions, timeout, polling):
+        try:
+            return wait_for_conditions(self.driver, conditions, mode=mode, timeout=timeout, polling=polling)
+        except TimeoutException as e:
+            self.logger.error(f"Wait for {mode} of {len(conditions)} conditions timed out: {e.msg}")
+            raise
+
     def get_element(self, locator, timeout=EXPLICIT_WAIT, polling=0.5, multiple=False):
         """
         Find element using given locator.
@@ -71,12 +223,12 @@ class BasePage:
             NoSuchElementException: If element is not found within the specified timeout.
         """
         try:
-            elements = self.wait_for_element(locator, timeout, polling)
-
             if multiple:
+                elements = self.wait_for_elements(locator, timeout, polling)
                 self.logger.info(f"Returning multiple elements with locator: {locator}")
                 return elements
             else:
+                elements = self.wait_for_element(locator, timeout, polling)
                 if isinstance(elements, list):
                     self.logger.info(f"Returning first element of multiple elements found with locator: {locator}")
                     return elements[0]
@@ -107,7 +259,7 @@ class BasePage:
             if element:
                 self.logger.info(f"Element found with locator: {locator}")
                 return True
-        except NoSuchElementException:
+        except (NoSuchElementException, TimeoutException):
             self.logger.info(f"Element not found with locator: {locator}")
             pass  # Element not found, continue to return False
         return False
@@ -416,7 +568,7 @@ class BasePage:
             visible: Flag indicating whether the element should be visible (optional).
         """
         try:
-            element = self.get_element(locator, timeout=timeout, visible=visible)
+            element = self.get_element(locator, timeout=timeout or EXPLICIT_WAIT)
             attr_value = element.get_attribute(attribute)
             self.logger.info(f"Attribute '{attribute}' value for element with locator {locator}: {attr_value}")
             return attr_value
@@ -0,0 +1,253 @@
+# pages/conditions.py
+"""
+Composite wait conditions.
+
+A ``Condition`` pairs a locator with a state (present, visible, gone or containing a text).
+``wait_for_conditions`` evaluates a whole list of them in one ``execute_script`` round trip per poll
+and decides whether any, all, or all in order are met, so a page that can take one of several branches
+(e.g. search results or a "no results" notice) is recognised as soon as either branch appears.
+"""
+import time
+from typing import Any, NamedTuple, Optional, Tuple
+
+from selenium.common import NoSuchElementException, StaleElementReferenceException, TimeoutException
+from selenium.webdriver.support.wait import WebDriverWait
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PRESENT = "present"
+VISIBLE = "visible"
+GONE = "gone"
+TEXT = "text"
+
+ANY = "any"
+ALL = "all"
+SEQUENCE = "sequence"
+
+# Evaluates every condition against the live DOM; returns one [met, element] pair per condition.
+_EVALUATE_SCRIPT = """
+function find(by, value) {
+    switch (by) {
+        case 'xpath':
+            return document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        case 'id':
+            return document.getElementById(value);
+        case 'name':
+            return document.getElementsByName(value)[0] || null;
+        case 'class name':
+            return document.getElementsByClassName(value)[0] || null;
+        case 'tag name':
+            return document.getElementsByTagName(value)[0] || null;
+        case 'link text':
+        case 'partial link text':
+            var links = document.getElementsByTagName('a');
+            for (var i = 0; i < links.length; i++) {
+                var text = links[i].textContent.trim();
+                if (by === 'link text' ? text === value.trim() : text.indexOf(value) !== -1) {
+                    return links[i];
+                }
+            }
+            return null;
+        default:
+            return document.querySelector(value);
+    }
+}
+function visible(element) {
+    return !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length)
+        && window.getComputedStyle(element).visibility !== 'hidden';
+}
+return arguments[0].map(function (condition) {
+    var element = find(condition[0], condition[1]);
+    switch (condition[2]) {
+        case 'visible':
+            return [!!element && visible(element), element];
+        case 'gone':
+            return [!element || !visible(element), null];
+        case 'text':
+            if (!element) {
+                return [false, null];
+            }
+            var text = element.innerText || element.textContent, expected = condition[3];
+            if (condition[4]) {
+                text = text.toLowerCase();
+                expected = expected.toLowerCase();
+            }
+            return [text.indexOf(expected) !== -1, element];
+        default:
+            return [!!element, element];
+    }
+});
+"""
+
+
+class Condition(NamedTuple):
+    """
+    A locator and the state it has to reach.
+
+    For ``text`` conditions, ``substring`` has to occur in the element's visible text, optionally ignoring case.
+    It is a plain string rather than a regular expression, so the browser and the browserless check agree.
+    """
+    locator: Tuple[str, str]
+    state: str = PRESENT
+    substring: Optional[str] = None
+    ignore_case: bool = False
+
+    @classmethod
+    def present(cls, locator):
+        return cls(tuple(locator), PRESENT)
+
+    @classmethod
+    def visible(cls, locator):
+        return cls(tuple(locator), VISIBLE)
+
+    @classmethod
+    def gone(cls, locator):
+        return cls(tuple(locator), GONE)
+
+    @classmethod
+    def text(cls, locator, substring, ignore_case=False):
+        return cls(tuple(locator), TEXT, substring, ignore_case)
+
+    def __str__(self):
+        detail = ""
+        if self.state == TEXT:
+            detail = f" {self.substring!r}" + (" (ignoring case)" if self.ignore_case else "")
+        return f"{self.state}{detail} {self.locator}"
+
+
+class WaitResult(NamedTuple):
+    """
+    Outcome of a composite wait.
+
+    ``index`` and ``condition`` identify the branch that matched (for all-of and ordered waits,
+    the last condition); ``elements`` holds the element found for every condition (None if gone or unmet).
+    """
+    index: int
+    condition: Condition
+    element: Any
+    elements: tuple
+    elapsed: float
+    polls: int
+
+
+def as_condition(condition):
+    """
+    Accept a Condition or a plain locator tuple, which means "present".
+    """
+    if isinstance(condition, Condition):
+        return condition
+    return Condition.present(condition)
+
+
+def _contains(text, condition):
+    # Same comparison as the browser script: lower-casing both sides when case is ignored
+    if condition.ignore_case:
+        return condition.substring.lower() in text.lower()
+    return condition.substring in text
+
+
+def _evaluate_static(driver, conditions):
+    # Browserless drivers cannot run scripts; their document never changes, so look up each condition directly
+    results = []
+    for condition in conditions:
+        elements = driver.find_elements(*condition.locator)
+        element = elements[0] if elements else None
+        if condition.state == VISIBLE:
+            results.append((element is not None and element.is_displayed(), element))
+        elif condition.state == GONE:
+            results.append((element is None or not element.is_displayed(), None))
+        elif condition.state == TEXT:
+            results.append((element is not None and _contains(element.text, condition), element))
+        else:
+            results.append((element is not None, element))
+    return results
+
+
+def evaluate_conditions(driver, conditions):
+    """
+    Evaluate all conditions once, in a single script call on a browser.
+
+    Returns:
+        list: One (met, element) pair per condition.
+    """
+    if getattr(driver, "is_static", False):
+        return _evaluate_static(driver, conditions)
+    payload = [[by, value, state, substring, ignore_case] for (by, value), state, substring, ignore_case in conditions]
+    return [(bool(met), element) for met, element in driver.execute_script(_EVALUATE_SCRIPT, payload)]
+
+
+def wait_for_conditions(driver, conditions, mode=ANY, timeout=10, polling=0.5):
+    """
+    Wait until any, all, or all in order of the given conditions are met.
+
+    In ``sequence`` mode each condition has to be observed after (or in the same poll as) the one before it;
+    a condition that was met once counts as done even if it stops holding later.
+
+    Args:
+        driver: WebDriver (or browserless driver) to evaluate the conditions on.
+        conditions (list): Condition objects or locator tuples.
+        mode (str): "any", "all" or "sequence" (default "any").
+        timeout (float): Maximum time to wait in seconds (default 10).
+        polling (float): Interval between evaluations in seconds (default 0.5).
+
+    Returns:
+        WaitResult: The matched branch, the elements found and the time it took.
+
+    Raises:
+        TimeoutException: If the conditions are not met within the timeout.
+    """
+    conditions = [as_condition(condition) for condition in conditions]
+    if not conditions:
+        raise ValueError("At least one condition is required")
+    if mode not in (ANY, ALL, SEQUENCE):
+        raise ValueError(f"Unsupported wait mode: {mode}. Supported modes: 'any', 'all', 'sequence'.")
+    static = getattr(driver, "is_static", False)
+    if static:
+        timeout = 0
+
+    state = {"polls": 0, "step": 0, "elements": [None] * len(conditions), "last": []}
+
+    # WebDriverWait retries on falsy results, so a match is returned as a one-item tuple (index 0 is falsy)
+    def poll(current_driver):
+        results = evaluate_conditions(current_driver, conditions)
+        state["polls"] += 1
+        state["last"] = results
+        if mode == ANY:
+            for index, (met, element) in enumerate(results):
+                if met:
+                    state["elements"][index] = element
+                    return (index,)
+            return False
+        if mode == ALL:
+            if all(met for met, _ in results):
+                state["elements"] = [element for _, element in results]
+                return (len(results) - 1,)
+            return False
+        while state["step"] < len(results) and results[state["step"]][0]:
+            state["elements"][state["step"]] = results[state["step"]][1]
+            state["step"] += 1
+        return (len(results) - 1,) if state["step"] == len(results) else False
+
+    start = time.monotonic()
+    wait = WebDriverWait(driver, timeout=timeout, poll_frequency=polling,
+                         ignored_exceptions=(NoSuchElementException, StaleElementReferenceException))
+    try:
+        if static:
+            # A static document never changes: one evaluation decides, without WebDriverWait's sleep before it gives up
+            matched = poll(driver)
+            if not matched:
+                raise TimeoutException()
+        else:
+            matched = wait.until(poll)
+        index, = matched
+    except TimeoutException:
+        unmet = [str(condition) for condition, (met, _) in zip(conditions, state["last"]) if not met]
+        raise TimeoutException(f"No {mode} match after {timeout}s ({state['polls']} polls); "
+                               f"unmet: {', '.join(unmet) or 'none evaluated'}")
+    elapsed = time.monotonic() - start
+    elements = tuple(state["elements"])
+    logger.info(f"Condition {conditions[index]} matched ({mode} of {len(conditions)}) after {elapsed:.3f}s "
+                f"and {state['polls']} polls")
+    return WaitResult(index, conditions[index], elements[index], elements, elapsed, state["polls"])
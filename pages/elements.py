@@ -0,0 +1,62 @@
+# pages/elements.py
+"""
+Declarative page elements.
+
+An ``Element`` is declared once on a page class::
+
+    class MagentoHomePage(BasePage):
+        route = ""
+        search_input = Element(By.ID, "search", ready=True)
+
+``BasePage`` turns the declarations into per-class metadata when the class is created: the locator tuple
+is published as ``_search_input`` for the ``BasePage`` helpers, the ``ready`` elements form the page's
+readiness check and ``route`` becomes the page URL.  On a page instance, ``page.search_input`` looks the
+element up on first access and returns the same WebElement afterwards.
+"""
+from pages.conditions import PRESENT, Condition
+from utils.config import EXPLICIT_WAIT
+
+
+class Element:
+    """
+    Class-level element declaration resolving to the WebElement (or list of them) on instance access.
+
+    Args:
+        by (str): Locator strategy (a selenium ``By`` value).
+        value (str): Locator value.
+        multiple (bool): Resolve to all matching elements instead of the first (default False).
+        ready (bool): Whether the page counts as ready only once this element reaches ``state`` (default False).
+        state (str): Readiness state, one of the pages.conditions states (default "present").
+        timeout (float): Maximum time to wait when the element is first accessed (default EXPLICIT_WAIT).
+    """
+
+    __slots__ = ("locator", "multiple", "ready", "condition", "timeout", "name")
+
+    def __init__(self, by, value, multiple=False, ready=False, state=PRESENT, timeout=EXPLICIT_WAIT):
+        self.locator = (by, value)
+        self.multiple = multiple
+        self.ready = ready
+        self.condition = Condition(self.locator, state)
+        self.timeout = timeout
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, page, owner=None):
+        if page is None:
+            return self
+        cache = page._elements
+        if cache is None:
+            cache = page._elements = {}
+        element = cache.get(self.name)
+        if element is None:
+            element = page.get_element(self.locator, timeout=self.timeout, multiple=self.multiple)
+            cache[self.name] = element
+        return element
+
+    def __set__(self, page, value):
+        raise AttributeError(f"Element '{self.name}' is declared by the page class and cannot be assigned")
+
+    def __repr__(self):
+        return f"Element({self.locator[0]!r}, {self.locator[1]!r})"
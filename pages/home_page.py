@@ -1,32 +1,32 @@
 from selenium.webdriver.common.by import By
 
 from pages.base_page import BasePage
+from pages.elements import Element
 from utils.logger import get_logger
 
 # Get logger instance
 from pages.search_results_page import SearchResultPage
 from utils.config import PAGE_LOAD_TIME
+from utils.web_metrics import measure_transition
 
 logger = get_logger(__name__)
 
 
 class MagentoHomePage(BasePage):
-    # Locators
-    _search_input = (By.ID, "search")
-    _search_button = (By.XPATH, "//button[@title='Search']")
-    _account_link = (By.XPATH, "//a[@data-action='customer-menu-toggle']")
-    _cart_link = (By.XPATH, "//a[@class='action showcart']")
-    _my_wishlist_link = (By.XPATH, "//a[@id='wishlist-link']")
-    _compare_products_link = (By.XPATH, "//a[@id='compare-products-link']")
-    _language_dropdown = (By.XPATH, "//div[@data-block='store-language']//button")
-    _currency_dropdown = (By.XPATH, "//div[@data-block='store-currency']//button")
-    _slider_next_button = (By.XPATH, "//button[@class='action next']")
-    _slider_previous_button = (By.XPATH, "//button[@class='action prev']")
-
-    def __init__(self, driver, time_out):
-        super().__init__(driver)
-        self.driver = driver
-        self.timeout = time_out
+    __slots__ = ()
+    route = ""
+
+    # Elements
+    search_input = Element(By.ID, "search", ready=True)
+    search_button = Element(By.XPATH, "//button[@title='Search']", ready=True)
+    account_link = Element(By.XPATH, "//a[@data-action='customer-menu-toggle']")
+    cart_link = Element(By.XPATH, "//a[@class='action showcart']")
+    my_wishlist_link = Element(By.XPATH, "//a[@id='wishlist-link']")
+    compare_products_link = Element(By.XPATH, "//a[@id='compare-products-link']")
+    language_dropdown = Element(By.XPATH, "//div[@data-block='store-language']//button")
+    currency_dropdown = Element(By.XPATH, "//div[@data-block='store-currency']//button")
+    slider_next_button = Element(By.XPATH, "//button[@class='action next']")
+    slider_previous_button = Element(By.XPATH, "//button[@class='action prev']")
 
     # Private methods to interact with elements
     def _search(self, query):
@@ -75,7 +75,8 @@ class MagentoHomePage(BasePage):
         """
         Search for a product using the search input field.
         """
-        self._search(product_name)
+        with measure_transition(self._driver, "search_results"):
+            self._search(product_name)
         return SearchResultPage(self._driver, PAGE_LOAD_TIME)
 
     def open_account_menu(self):
@@ -110,14 +111,16 @@ class MagentoHomePage(BasePage):
         """
         Change the language of the website.
         """
-        self._select_language(language_code)
+        with measure_transition(self._driver, "language_switch"):
+            self._select_language(language_code)
         logger.info(f"Changed language to: {language_code}")
 
     def change_currency(self, currency_code):
         """
         Change the currency of the website.
         """
-        self._select_currency(currency_code)
+        with measure_transition(self._driver, "currency_switch"):
+            self._select_currency(currency_code)
         logger.info(f"Changed currency to: {currency_code}")
 
     def navigate_slider_next(self):
@@ -1,26 +1,182 @@
+from typing import NamedTuple, Optional
+
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support.wait import WebDriverWait
 
 from pages.base_page import BasePage
+from pages.conditions import Condition
+from pages.elements import Element
 from utils.logger import get_logger
 
 from utils.config import PAGE_LOAD_TIME
 
 logger = get_logger(__name__)
 
+# Extracts every product card of the current result page in a single round trip.
+_EXTRACT_PRODUCTS_SCRIPT = """
+var cards = document.querySelectorAll(arguments[0]);
+var items = [];
+for (var i = 0; i < cards.length; i++) {
+    var link = cards[i].querySelector(arguments[1]);
+    var price = cards[i].querySelector(arguments[2]);
+    var box = cards[i].querySelector(arguments[3]);
+    items.push([
+        link ? link.textContent.trim() : '',
+        link ? link.href : '',
+        price ? price.getAttribute('data-price-amount') : null,
+        box ? box.getAttribute('data-product-id') : null
+    ]);
+}
+var next = document.querySelector(arguments[4]);
+return [items, next ? next.href : null];
+"""
+
+# Marks the current document as stale and starts loading the next page without blocking.
+_PREFETCH_SCRIPT = """
+document.documentElement.setAttribute('data-prefetch-stale', '1');
+window.location.href = arguments[0];
+"""
+
+_PREFETCH_READY_SCRIPT = """
+return document.readyState === 'complete' && !document.documentElement.hasAttribute('data-prefetch-stale');
+"""
+
+
+class ProductCard(NamedTuple):
+    """
+    A product card from a search result page.
+    """
+    name: str
+    url: str
+    price: Optional[float]
+    product_id: Optional[str]
+
 
 class SearchResultPage(BasePage):
-    # Locators
-    _search_results = (By.XPATH, "//div[@class='search results']")
+    __slots__ = ()
+    route = "catalogsearch/result/"
 
-    def __init__(self, driver, time_out):
-        super().__init__(driver)
-        self.driver = driver
-        self.timeout = time_out
+    # Elements
+    search_results = Element(By.XPATH, "//div[@class='search results']")
+    product_item = Element(By.CSS_SELECTOR, "li.product-item")
+    product_link = Element(By.CSS_SELECTOR, "a.product-item-link")
+    product_price = Element(By.CSS_SELECTOR, "[data-price-type='finalPrice']")
+    product_price_box = Element(By.CSS_SELECTOR, ".price-box[data-product-id]")
+    next_page_link = Element(By.CSS_SELECTOR, ".pages-item-next a")
+    no_results_notice = Element(By.CSS_SELECTOR, ".column.main .message.notice")
 
     # Private methods to interact with elements
     def _get_search_results(self):
         return self.is_element_present(self._search_results)
 
+    def _extract_page(self):
+        items, next_url = self.driver.execute_script(
+            _EXTRACT_PRODUCTS_SCRIPT, self._product_item[1], self._product_link[1], self._product_price[1],
+            self._product_price_box[1], self._next_page_link[1])
+        products = [ProductCard(name, url, float(price) if price else None, product_id)
+                    for name, url, price, product_id in items]
+        logger.info(f"Extracted {len(products)} products, next page: {next_url}")
+        return products, next_url
+
+    def _prefetch(self, handle, url):
+        self.driver.switch_to.window(handle)
+        self.driver.execute_script(_PREFETCH_SCRIPT, url)
+
+    def _wait_for_prefetched_page(self):
+        WebDriverWait(self.driver, timeout=self.timeout, poll_frequency=0.1).until(
+            lambda driver: driver.execute_script(_PREFETCH_READY_SCRIPT))
+
     # Public methods
     def are_search_results_displayed(self):
         return self._get_search_results()
+
+    def has_search_results(self):
+        """
+        Wait for either the result list or the "no results" notice, whichever appears first.
+
+        Returns:
+            bool: True if results are displayed, False if the search returned no results.
+        """
+        outcome = self.wait_for_any(Condition.visible(self._search_results), Condition.visible(self._no_results_notice),
+                                    timeout=self.timeout)
+        logger.info(f"Search outcome: {'results' if outcome.index == 0 else 'no results'} after {outcome.elapsed:.2f}s")
+        return outcome.index == 0
+
+    def get_products(self):
+        """
+        Extract all product cards of the current result page in a single script call.
+
+        Returns:
+            list: ProductCard records in page order.
+        """
+        return self._extract_page()[0]
+
+    def iter_result_pages(self, max_pages=None, prefetch=True):
+        """
+        Walk the result pages lazily, yielding the product cards of each page.
+
+        While a page is being consumed, the next one is already loading in a background tab. When
+        iteration ends, the background tab is closed and the driver stays on the last page yielded, in
+        the tab the walk started in (other code may hold that window handle, so it is never closed).
+
+        Args:
+            max_pages (int): Maximum number of pages to walk (default: all pages).
+            prefetch (bool): Whether to load the next page in a background tab (default True).
+
+        Yields:
+            list: ProductCard records of one result page.
+        """
+        origin = current = self.driver.current_window_handle
+        spare = None
+        products, next_url = self._extract_page()
+        pages = 0
+        try:
+            while True:
+                pages += 1
+                has_next = next_url is not None and (max_pages is None or pages < max_pages)
+                if has_next and prefetch:
+                    if spare is None:
+                        self.driver.switch_to.new_window("tab")
+                        spare = self.driver.current_window_handle
+                    self._prefetch(spare, next_url)
+                    self.driver.switch_to.window(current)
+
+                yield products
+                if not has_next:
+                    return
+
+                if prefetch:
+                    self.driver.switch_to.window(spare)
+                    self._wait_for_prefetched_page()
+                    current, spare = spare, current
+                else:
+                    self.driver.get(next_url)
+                products, next_url = self._extract_page()
+        finally:
+            if spare is not None:
+                if current == origin:
+                    self.driver.switch_to.window(spare)
+                    self.driver.close()
+                else:
+                    # The last page is in the prefetch tab: show it in the original tab and close the other
+                    self.driver.switch_to.window(current)
+                    last_url = self.driver.current_url
+                    self.driver.close()
+                    self.driver.switch_to.window(origin)
+                    self.driver.get(last_url)
+                    self.reset_elements()
+                self.driver.switch_to.window(origin)
+
+    def iter_products(self, max_pages=None, prefetch=True):
+        """
+        Iterate over the product cards of all result pages.
+
+        Args:
+            max_pages (int): Maximum number of pages to walk (default: all pages).
+            prefetch (bool): Whether to load the next page in a background tab (default True).
+
+        Yields:
+            ProductCard: One product card at a time.
+        """
+        for products in self.iter_result_pages(max_pages=max_pages, prefetch=prefetch):
+            yield from products
@@ -0,0 +1,90 @@
+import json
+import time
+
+import pytest
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import wait as wait_module
+
+from pages.search_results_page import SearchResultPage
+from utils.command_replay import ReplayMismatchError, ReplayWebDriver, record_commands, recording_path
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+NO_SUCH_ELEMENT = {"status": 404, "value": json.dumps({"value": {"error": "no such element", "message": "missing"}})}
+
+
+class _ScriptedExecutor:
+    """
+    Fake command executor: the search results appear on the third lookup.
+    """
+
+    def __init__(self):
+        self.lookups = 0
+
+    def execute(self, command, params):
+        if command == "newSession":
+            return {"value": {"sessionId": "session-1", "capabilities": {"browserName": "chrome"}}}
+        if command == "findElement":
+            self.lookups += 1
+            return NO_SUCH_ELEMENT if self.lookups < 3 else {"value": {ELEMENT_KEY: "element-1"}}
+        if command == "getElementText":
+            return {"value": "Search results for: 'shirt'"}
+        return {"value": None}
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def recording(tmp_path):
+    path = str(tmp_path / "session.jsonl.gz")
+    driver = WebDriver(command_executor=_ScriptedExecutor(), options=ArgOptions())
+    record_commands(driver, path)
+    page = SearchResultPage(driver, 5)
+    page.are_search_results_displayed()
+    page.get_element_text(page._search_results)
+    driver.quit()
+    return path
+
+
+def test_replay_serves_recorded_responses_on_virtual_time(recording):
+    driver = ReplayWebDriver(recording)
+    page = SearchResultPage(driver, 5)
+    start = time.monotonic()
+    assert page.are_search_results_displayed()
+    assert page.get_element_text(page._search_results) == "Search results for: 'shirt'"
+    driver.quit()
+    assert time.monotonic() - start < 0.5, "Replay must not sleep between polls"
+    assert driver.clock.now >= 1.0, "Virtual clock advances by the recorded poll intervals"
+    driver.assert_replayed()
+
+
+def test_replay_reports_diverging_commands(recording):
+    driver = ReplayWebDriver(recording)
+    page = SearchResultPage(driver, 5)
+    assert page.are_search_results_displayed()
+    with pytest.raises(ReplayMismatchError, match=r"Command #3 does not match") as error:
+        page.get_element_text((By.ID, "search"))
+    assert error.value.expected[1] != error.value.actual[1]
+    assert "last matched commands" in str(error.value)
+    with pytest.raises(ReplayMismatchError):
+        driver.quit()
+
+
+def test_overlapping_replays_restore_the_time_module(recording):
+    first = ReplayWebDriver(recording)
+    second = ReplayWebDriver(recording)
+    assert wait_module.time is second.clock
+    for driver in (first, second):
+        page = SearchResultPage(driver, 5)
+        assert page.are_search_results_displayed()
+        page.get_element_text(page._search_results)
+        driver.quit()
+    assert wait_module.time is time
+
+
+def test_each_session_records_to_its_own_file(pytestconfig, monkeypatch):
+    assert recording_path(pytestconfig, "rec/run.jsonl.gz", "start_browser") == "rec/run.start_browser.jsonl.gz"
+    monkeypatch.setattr(pytestconfig, "workerinput", {"workerid": "gw1"}, raising=False)
+    assert recording_path(pytestconfig, "rec/run.jsonl.gz", "other") == "rec/run.other.gw1.jsonl.gz"
@@ -0,0 +1,73 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from selenium.common import TimeoutException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.conditions import Condition
+from pages.search_results_page import SearchResultPage
+from utils.http_driver import HttpDriver
+
+RESULTS = (By.CSS_SELECTOR, ".search.results")
+NOTICE = (By.CSS_SELECTOR, ".message.notice")
+SPINNER = (By.ID, "spinner")
+
+
+class _ScriptedDriver:
+    """
+    Fake driver whose composite-condition script returns one scripted poll result per call.
+    """
+
+    def __init__(self, *polls):
+        self._polls = list(polls)
+        self.calls = []
+
+    def execute_script(self, script, conditions):
+        self.calls.append(conditions)
+        return self._polls.pop(0) if len(self._polls) > 1 else self._polls[0]
+
+
+def _page(driver):
+    return BasePage(driver)
+
+
+def test_wait_for_any_evaluates_all_branches_in_one_call_per_poll():
+    driver = _ScriptedDriver([[False, None], [False, None]], [[False, None], [True, "notice"]])
+    result = _page(driver).wait_for_any(Condition.visible(RESULTS), Condition.visible(NOTICE), polling=0.01)
+    assert (result.index, result.element, result.polls) == (1, "notice", 2)
+    assert result.condition == Condition.visible(NOTICE)
+    assert len(driver.calls) == 2
+    assert driver.calls[0] == [["css selector", ".search.results", "visible", None, False],
+                               ["css selector", ".message.notice", "visible", None, False]]
+
+
+def test_wait_for_sequence_requires_conditions_in_order():
+    driver = _ScriptedDriver([[False, None], [True, None]], [[True, None], [False, None]],
+                             [[True, None], [True, None]])
+    result = _page(driver).wait_for_sequence(Condition.visible(SPINNER), Condition.gone(SPINNER), polling=0.01)
+    assert (result.index, result.polls) == (1, 3)
+
+
+def test_wait_for_all_times_out_listing_unmet_conditions():
+    driver = _ScriptedDriver([[True, "results"], [False, None]])
+    with pytest.raises(TimeoutException, match=r"unmet: text '2 items' \(ignoring case\)"):
+        _page(driver).wait_for_all(RESULTS, Condition.text(NOTICE, "2 items", ignore_case=True), timeout=0.05,
+                                   polling=0.01)
+
+
+def test_search_outcome_on_static_document():
+    body = b"<html><body><div class='column main'><div class='message notice'>No results</div></div></body></html>"
+    response = SimpleNamespace(status=200, headers={"Content-Type": "text/html"}, url="/search", data=body)
+    driver = HttpDriver(http=SimpleNamespace(request=lambda method, url: response))
+    driver.get("http://shop.test/search")
+    assert SearchResultPage(driver, 5).has_search_results() is False
+    assert _page(driver).wait_for_any(Condition.text(NOTICE, "no results", ignore_case=True)).index == 0
+    with pytest.raises(TimeoutException):
+        _page(driver).wait_for_any(Condition.text(NOTICE, "no results"))
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutException, match="unmet: present"):
+        _page(driver).wait_for_any(SPINNER, timeout=5, polling=0.5)
+    assert time.monotonic() - start < 0.1, "A static document is evaluated once, without sleeping"
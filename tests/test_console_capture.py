@@ -0,0 +1,135 @@
+import json
+import queue
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+import trio
+from trio_websocket import ConnectionClosed, serve_websocket
+
+from utils.console_capture import ConsoleCollector, ConsoleLog, _driver_under_test
+
+
+def _attached(session_id, target_id):
+    info = {"targetId": target_id, "type": "page", "title": "", "url": "about:blank", "attached": True,
+            "canAccessOpener": False}
+    return {"method": "Target.attachedToTarget",
+            "params": {"sessionId": session_id, "targetInfo": info, "waitingForDebugger": True}}
+
+
+async def _fake_browser(request):
+    # Auto-attaches the first tab, then a second one as if a test had opened it, which throws once it runs;
+    # a tab attached explicitly throws the same way
+    ws = await request.accept()
+    while True:
+        try:
+            message = json.loads(await ws.get_message())
+        except ConnectionClosed:
+            return
+        reply = {"id": message["id"], "result": {}}
+        if "sessionId" in message:
+            reply["sessionId"] = message["sessionId"]
+        if message["method"] == "Target.setAutoAttach":
+            await ws.send_message(json.dumps(_attached("first", "tab-1")))
+            await ws.send_message(json.dumps(reply))
+            await ws.send_message(json.dumps(_attached("second", "tab-2")))
+            continue
+        if message["method"] == "Target.attachToTarget":
+            await ws.send_message(json.dumps(_attached("watched", message["params"]["targetId"])))
+            reply["result"] = {"sessionId": "watched"}
+        await ws.send_message(json.dumps(reply))
+        if message["method"] == "Runtime.runIfWaitingForDebugger" and message["sessionId"] in ("second", "watched"):
+            details = {"exceptionId": 1, "text": "Uncaught", "lineNumber": 0, "columnNumber": 0,
+                       "url": "https://shop/tab.js", "exception": {"type": "object", "description": "TypeError: boom"}}
+            await ws.send_message(json.dumps({"method": "Runtime.exceptionThrown", "sessionId": message["sessionId"],
+                                              "params": {"timestamp": 1.0, "exceptionDetails": details}}))
+            await ws.send_message(json.dumps({"method": "Target.detachedFromTarget",
+                                              "params": {"sessionId": message["sessionId"]}}))
+
+
+@pytest.fixture
+def fake_browser():
+    ports = queue.Queue()
+
+    async def serve():
+        async with trio.open_nursery() as nursery:
+            server = await nursery.start(serve_websocket, _fake_browser, "127.0.0.1", 0, None)
+            ports.put(server.port)
+
+    threading.Thread(target=trio.run, args=(serve,), daemon=True).start()
+    port = ports.get(timeout=5)
+    return SimpleNamespace(session_id="session", caps={
+        "browserName": "chrome", "se:cdp": f"ws://127.0.0.1:{port}/devtools/browser", "se:cdpVersion": "123.0"})
+
+
+def test_tabs_opened_later_are_captured(fake_browser):
+    collector = ConsoleCollector()
+    assert collector.start(fake_browser, timeout=5)
+    try:
+        deadline = time.monotonic() + 5
+        while not collector.errors() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert [(event.text, event.url) for event in collector.errors()] == [("TypeError: boom", "https://shop/tab.js")]
+        assert collector.error is None
+    finally:
+        collector.stop()
+
+
+def test_without_auto_attach_only_watched_tabs_are_captured(fake_browser):
+    collector = ConsoleCollector()
+    assert collector.start(fake_browser, timeout=5, auto_attach=False)
+    try:
+        assert collector.errors() == []
+        assert collector.watch("tab-9", timeout=5)
+        deadline = time.monotonic() + 5
+        while not collector.errors() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert [event.text for event in collector.errors()] == ["TypeError: boom"]
+    finally:
+        collector.stop()
+
+
+def _collector_with_events():
+    collector = ConsoleCollector(max_events=3)
+    collector._append("console", "log", "page loaded", None, 1.0)
+    collector._append("console", "warning", "deprecated API", None, 2.0)
+    collector._append("exception", "error", "TypeError: x is undefined", "https://shop/app.js", 3.0)
+    return collector
+
+
+def test_events_are_filtered_by_mark_level_and_pattern():
+    collector = _collector_with_events()
+    assert [event.text for event in collector.events(level="warning")] == ["deprecated API"]
+    assert [event.seq for event in collector.events(since=1)] == [2, 3]
+    assert [event.kind for event in collector.events(pattern="TypeError")] == ["exception"]
+
+
+def test_buffer_is_bounded():
+    collector = _collector_with_events()
+    collector._append("console", "error", "late error", None, 4.0)
+    assert len(collector.events()) == 3
+    assert collector.dropped == 1
+
+
+def test_console_log_only_sees_events_after_the_test_started():
+    collector = _collector_with_events()
+    log = ConsoleLog(collector)
+    assert log.errors() == []
+    collector._append("console", "error", "Failed to load resource: 404", None, 5.0)
+    collector._append("exception", "error", "ReferenceError: jQuery is not defined", None, 6.0)
+
+    assert len(log.errors()) == 2
+    with pytest.raises(AssertionError, match="ReferenceError"):
+        log.assert_no_errors(ignore=[r"Failed to load resource"])
+
+
+@pytest.mark.parametrize("fixturenames, expected", [
+    (["page_driver", "console_log"], "page driver"),
+    (["tab_browser", "start_browser", "console_log"], "tab driver"),
+    (["console_log"], "session driver"),
+])
+def test_console_log_follows_the_driver_the_test_uses(fixturenames, expected):
+    values = {"page_driver": "page driver", "tab_browser": "tab driver", "start_browser": "session driver"}
+    request = SimpleNamespace(fixturenames=fixturenames, getfixturevalue=values.__getitem__)
+    assert _driver_under_test(request) == expected
@@ -1,7 +1,8 @@
 import pytest
 
 from pages.home_page import MagentoHomePage
-from utils.config import PAGE_LOAD_TIME
+from pages.search_results_page import SearchResultPage
+from utils.config import PAGE_LOAD_TIME, URL
 from utils.logger import get_logger
 
 # Get logger instance
@@ -22,6 +23,24 @@ def test_search_product(start_browser, search_query):
     logger.info("Search results are displayed successfully.")
 
 
+@pytest.mark.browserless(url=f"{URL}catalogsearch/result/?q=shirt")
+def test_search_results_present_browserless(page_driver):
+    logger.info("Starting test_search_results_present_browserless")
+    search_results = SearchResultPage(page_driver, PAGE_LOAD_TIME)
+    # Assert that the server-rendered page contains search results
+    assert search_results.are_search_results_displayed(), "Search results are not displayed"
+    logger.info("Search results are present in the server-rendered page.")
+
+
+@pytest.mark.shared_tab(url=f"{URL}catalogsearch/result/?q=jacket")
+def test_search_results_in_shared_tab(tab_browser):
+    logger.info("Starting test_search_results_in_shared_tab")
+    search_results = SearchResultPage(tab_browser, PAGE_LOAD_TIME)
+    # Assert that search results are displayed in the test's own tab
+    assert search_results.are_search_results_displayed(), "Search results are not displayed"
+    logger.info("Search results are displayed successfully.")
+
+
 # def test_open_account_menu(start_browser):
 #     logger.info("Starting test_open_account_menu")
 #     browser = start_browser
@@ -106,3 +125,22 @@ def test_search_product(start_browser, search_query):
 #     magento_home.navigate_slider_previous()
 #     # Add assertions here
 #     logger.info("Slider navigated to the previous item successfully.")
+
+
+@pytest.mark.parametrize(
+    "search_query, max_pages",
+    [("shirt", 2)]
+)
+def test_search_result_products(start_browser, search_query, max_pages):
+    logger.info(f"Starting test_search_result_products with search query: {search_query}")
+    browser = start_browser
+    magento_home = MagentoHomePage(browser, PAGE_LOAD_TIME)
+    search_results = magento_home.search_for_product(search_query)
+    pages = list(search_results.iter_result_pages(max_pages=max_pages))
+    # Assert that every product card on every walked page has a name, link and price
+    assert pages and pages[0], "No products extracted from search results"
+    for products in pages:
+        for product in products:
+            assert product.name and product.url, f"Incomplete product card: {product}"
+            assert product.price is not None, f"Product without price: {product}"
+    logger.info(f"Extracted {sum(len(products) for products in pages)} products from {len(pages)} pages.")
@@ -0,0 +1,78 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.search_results_page import SearchResultPage
+from utils.config import PAGE_LOAD_TIME
+from utils.http_driver import BrowserRequired, HttpDriver
+
+PAGES = {
+    "/search": """<html><head><title> Search results for: 'shirt' </title></head><body>
+        <input id="search" name="q" value="shirt" disabled>
+        <div class="search results"><ol>
+            <li class="product-item"><a class="product-item-link" href="/shirt-1.html"> Blue   Shirt </a></li>
+            <li class="product-item"><a class="product-item-link" href="/shirt-2.html">Red Shirt</a>
+                <script>var ignored = 1;</script></li>
+        </ol></div></body></html>""",
+    "/empty": "<html><head><title>No results</title></head><body><div class='message notice'>None</div></body></html>",
+}
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = PAGES.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def site():
+    server = HTTPServer(("127.0.0.1", 0), _PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_locators_resolve_against_static_document(site):
+    driver = HttpDriver()
+    driver.get(f"{site}/search")
+    assert driver.title == "Search results for: 'shirt'"
+    assert driver.find_element(By.ID, "search").get_attribute("disabled") == "true"
+    assert driver.find_element(By.NAME, "q").get_attribute("value") == "shirt"
+    links = driver.find_elements(By.CSS_SELECTOR, "li.product-item a.product-item-link")
+    assert [link.text for link in links] == ["Blue Shirt", "Red Shirt"]
+    assert links[0].get_attribute("href") == f"{site}/shirt-1.html"
+    item = driver.find_element(By.XPATH, "//li[@class='product-item'][2]")
+    assert item.text == "Red Shirt"
+
+
+def test_page_objects_run_without_a_browser(site):
+    driver = HttpDriver()
+    driver.get(f"{site}/search")
+    assert SearchResultPage(driver, PAGE_LOAD_TIME).are_search_results_displayed()
+
+    driver.get(f"{site}/empty")
+    start = time.monotonic()
+    assert not SearchResultPage(driver, PAGE_LOAD_TIME).are_search_results_displayed()
+    assert time.monotonic() - start < 0.1, "Absent elements must not wait on a static document"
+
+
+def test_http_errors_require_a_browser(site):
+    with pytest.raises(BrowserRequired):
+        HttpDriver().get(f"{site}/missing")
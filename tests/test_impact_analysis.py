@@ -0,0 +1,96 @@
+import os
+import shutil
+
+from pages import base_page, conditions
+from pages.search_results_page import SearchResultPage
+from utils.config import PROJECT_ROOT
+from utils.impact_analysis import ImpactRecorder, SymbolIndex, affected_tests, code_symbols, module_symbols
+
+PAGE_SOURCE = '''
+from selenium.webdriver.common.by import By
+
+
+class DemoPage:
+    _title = (By.ID, "title")
+
+    def read_title(self):
+        return self._title
+'''
+
+
+class _StubDriver:
+
+    def find_element(self, by, value):
+        return object()
+
+
+def test_module_symbols_ignore_formatting(tmp_path):
+    page_file = tmp_path / "demo_page.py"
+    page_file.write_text(PAGE_SOURCE)
+    before = module_symbols(str(page_file))
+
+    page_file.write_text(PAGE_SOURCE.replace("return self._title", "return self._title  # unchanged"))
+    assert module_symbols(str(page_file)) == before
+
+    page_file.write_text(PAGE_SOURCE.replace('"title"', '"heading"'))
+    after = module_symbols(str(page_file))
+    assert after["DemoPage._title"] != before["DemoPage._title"]
+    assert after["DemoPage.read_title"] == before["DemoPage.read_title"]
+
+
+def test_affected_tests_only_selects_changed_symbols(tmp_path):
+    (tmp_path / "demo_page.py").write_text(PAGE_SOURCE)
+    digests = module_symbols(str(tmp_path / "demo_page.py"))
+    impact_map = {"tests": {
+        "test_title": {"symbols": {"demo_page.py::DemoPage._title": digests["DemoPage._title"]}},
+        "test_read": {"symbols": {"demo_page.py::DemoPage.read_title": digests["DemoPage.read_title"]}},
+    }}
+
+    (tmp_path / "demo_page.py").write_text(PAGE_SOURCE.replace('"title"', '"heading"'))
+    affected = affected_tests(["test_title", "test_read", "test_new"], impact_map, SymbolIndex(str(tmp_path)))
+    assert affected == {"test_title", "test_new"}
+
+
+def test_unknown_recorded_digests_count_as_affected(tmp_path):
+    (tmp_path / "demo_page.py").write_text(PAGE_SOURCE)
+    impact_map = {"tests": {"test_gone": {"symbols": {"demo_page.py::DemoPage.removed": None}}}}
+    assert affected_tests(["test_gone"], impact_map, SymbolIndex(str(tmp_path))) == {"test_gone"}
+
+
+def test_code_objects_map_to_digested_symbols():
+    symbols = code_symbols(conditions)
+    nested = [symbol for code, symbol in symbols.items() if code.co_name == "poll"]
+    assert nested == ["wait_for_conditions"]
+    assert code_symbols(base_page)[base_page.BasePage.get_element.__code__] == "BasePage.get_element"
+    digests = module_symbols(os.path.join(PROJECT_ROOT, "pages", "conditions.py"))
+    assert set(symbols.values()) <= set(digests)
+
+
+def test_recorder_captures_page_methods_and_locators():
+    recorder = ImpactRecorder()
+    recorder.start()
+    try:
+        SearchResultPage(_StubDriver(), 1).are_search_results_displayed()
+    finally:
+        touched = recorder.stop()
+
+    assert "pages/search_results_page.py::SearchResultPage.are_search_results_displayed" in touched
+    assert "pages/search_results_page.py::SearchResultPage.search_results" in touched
+    assert "pages/base_page.py::BasePage.get_element" in touched
+
+
+def test_changed_element_locator_selects_the_test(tmp_path):
+    recorder = ImpactRecorder()
+    recorder.start()
+    try:
+        SearchResultPage(_StubDriver(), 1).are_search_results_displayed()
+    finally:
+        touched = recorder.stop()
+    index = SymbolIndex()
+    impact_map = {"tests": {"test_results": {"symbols": {key: index.digest(key) for key in touched}}}}
+    assert None not in impact_map["tests"]["test_results"]["symbols"].values()
+
+    shutil.copytree(os.path.join(PROJECT_ROOT, "pages"), tmp_path / "pages")
+    page_file = tmp_path / "pages" / "search_results_page.py"
+    page_file.write_text(page_file.read_text().replace("//div[@class='search results']", "//div[@id='results']"))
+    assert affected_tests(["test_results"], impact_map, SymbolIndex(str(tmp_path))) == {"test_results"}
@@ -0,0 +1,56 @@
+import pytest
+
+from utils.load_runner import LatencyHistogram, LoadRunner
+
+
+class _FakeDriver:
+
+    def __init__(self):
+        self.quit_calls = 0
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+def test_histogram_percentiles_stay_within_one_bucket():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.add(float(ms))
+    assert histogram.count == 1000
+    assert 500 <= histogram.percentile(50) <= 500 * 2 ** 0.25
+    assert 990 <= histogram.percentile(99) <= 1000
+    assert histogram.percentile(100) == 1000
+    assert len(histogram.buckets) < 50
+
+
+def test_runner_times_steps_and_counts_failed_journeys():
+    drivers = []
+
+    def driver_factory():
+        drivers.append(_FakeDriver())
+        return drivers[-1]
+
+    def browse(user):
+        with user.step("home"):
+            pass
+
+    def checkout(user):
+        with user.step("pay"):
+            raise RuntimeError("payment declined")
+
+    runner = LoadRunner("http://shop.test/", [("browse", browse), ("checkout", checkout)], users=3, ramp_up=0.03,
+                        iterations=4, think_time=0, driver_factory=driver_factory)
+    summary = runner.run()
+
+    assert [driver.quit_calls for driver in drivers] == [1, 1, 1]
+    assert summary["journeys"] == {"browse": {"completed": 6, "failed": 0}, "checkout": {"completed": 0, "failed": 6}}
+    assert summary["steps"]["home"]["count"] == 6
+    assert summary["steps"]["pay"]["errors"] == 6
+    assert summary["steps"]["start_browser"]["count"] == 3
+    assert summary["throughput"]["journeys_per_s"] > 0
+    assert summary["errors"][0] == "pay: RuntimeError: payment declined"
+
+
+def test_runner_requires_a_journey():
+    with pytest.raises(ValueError):
+        LoadRunner("http://shop.test/", [])
@@ -0,0 +1,81 @@
+from types import SimpleNamespace
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage
+from pages.elements import Element
+from pages.home_page import MagentoHomePage
+from pages.search_results_page import SearchResultPage
+from utils.config import URL
+from utils.http_driver import HttpDriver
+
+HOME = b"""<html><body><form><input id="search" name="q"><button title="Search">Search</button></form>
+    <div data-block="store-currency"><button>USD</button></div></body></html>"""
+
+
+class _CountingDriver(HttpDriver):
+
+    def __init__(self, body):
+        response = SimpleNamespace(status=200, headers={"Content-Type": "text/html"}, url="/", data=body)
+        super().__init__(http=SimpleNamespace(request=lambda method, url: response))
+        self.lookups = 0
+
+    def find_element(self, by=By.ID, value=None):
+        self.lookups += 1
+        return super().find_element(by, value)
+
+
+def test_page_metadata_is_precomputed_per_class():
+    assert MagentoHomePage._search_input == (By.ID, "search")
+    assert MagentoHomePage._currency_dropdown == (By.XPATH, "//div[@data-block='store-currency']//button")
+    assert [condition.locator for condition in MagentoHomePage._ready_conditions] == [
+        MagentoHomePage._search_input, MagentoHomePage._search_button]
+    assert SearchResultPage._page_url == f"{URL}catalogsearch/result/"
+    assert SearchResultPage._ready_conditions == ()
+
+    class FilteredResultPage(SearchResultPage):
+        __slots__ = ()
+        filter_panel = Element(By.ID, "layered-filter-block", ready=True)
+
+    assert set(FilteredResultPage._element_declarations) == {*SearchResultPage._element_declarations, "filter_panel"}
+    assert FilteredResultPage._filter_panel == (By.ID, "layered-filter-block")
+
+
+def test_pages_are_slotted():
+    page = MagentoHomePage(_CountingDriver(HOME), 5)
+    assert not hasattr(page, "__dict__")
+    assert (page.driver, page.timeout) == (page._driver, 5)
+    with pytest.raises(AttributeError):
+        page.search_query = "shirt"
+    with pytest.raises(AttributeError):
+        page.search_input = None
+
+
+def test_elements_resolve_lazily_once_per_page():
+    driver = _CountingDriver(HOME)
+    driver.get("http://shop.test/")
+    page = MagentoHomePage(driver, 5)
+    assert driver.lookups == 0
+    assert page.wait_until_ready().index == 1
+    assert page.currency_dropdown.text == "USD"
+    assert page.currency_dropdown is page.currency_dropdown
+    assert driver.lookups == 1
+    page.reset_elements()
+    assert page.currency_dropdown.text == "USD"
+    assert driver.lookups == 2
+
+
+def test_multiple_elements_resolve_to_a_list():
+    class CurrencyMenu(BasePage):
+        __slots__ = ()
+        currencies = Element(By.CSS_SELECTOR, "li a", multiple=True)
+
+    driver = _CountingDriver(b"<html><body><ul><li><a>EUR</a></li><li><a>GBP</a></li></ul></body></html>")
+    driver.get("http://shop.test/")
+    assert [link.text for link in CurrencyMenu(driver, 5).currencies] == ["EUR", "GBP"]
+
+
+def test_open_requires_a_route():
+    with pytest.raises(ValueError, match="BasePage has no route"):
+        BasePage.open(_CountingDriver(HOME))
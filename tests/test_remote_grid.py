@@ -0,0 +1,72 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from selenium.webdriver.remote.command import Command
+
+from utils.remote_grid import HostPool, PooledRemoteConnection, merge_stats
+
+
+class _StatusHandler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        body = json.dumps({"value": {"ready": True, "message": "ready"}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def status_server():
+    server = HTTPServer(("127.0.0.1", 0), _StatusHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_candidates_rotate_by_shard_key():
+    pool = HostPool(["http://a:1", "http://b:1", "http://c:1"])
+    assert [host.url for host in pool.candidates(shard_key=4)] == ["http://b:1", "http://c:1", "http://a:1"]
+
+
+def test_health_check_marks_unreachable_hosts(status_server):
+    pool = HostPool([status_server, "http://127.0.0.1:9"], health_timeout=0.5)
+    healthy, unreachable = pool.hosts
+    assert pool.check_health(healthy) is True
+    assert healthy.health_latency is not None
+    assert pool.check_health(unreachable) is False
+
+
+def test_pooled_connection_keeps_alive_and_records_latency(status_server):
+    pool = HostPool([status_server])
+    host = pool.hosts[0]
+    connection = PooledRemoteConnection(host, pool_maxsize=7)
+    assert connection.keep_alive
+    assert connection._conn.connection_pool_kw["maxsize"] == 7
+
+    response = connection.execute(Command.GET_CURRENT_URL, {"sessionId": "session-1"})
+    assert response["value"]["ready"] is True
+    assert host.commands == 1
+
+
+def test_worker_stats_merge_per_host():
+    def stats(url, healthy, sessions, commands, mean, maximum):
+        return {"url": url, "healthy": healthy, "health_latency_ms": 2.0, "active_sessions": 0,
+                "total_sessions": sessions, "failures": 0, "commands": commands, "mean_latency_ms": mean,
+                "max_latency_ms": maximum}
+
+    gw0 = [stats("http://grid-a", True, 1, 10, 20.0, 50.0), stats("http://grid-b", None, 0, 0, 0.0, 0.0)]
+    gw1 = [stats("http://grid-a", True, 2, 30, 40.0, 90.0), stats("http://grid-b", False, 0, 0, 0.0, 0.0)]
+    grid_a, grid_b = merge_stats([gw0, gw1])
+
+    assert (grid_a["total_sessions"], grid_a["commands"]) == (3, 40)
+    assert (grid_a["mean_latency_ms"], grid_a["max_latency_ms"], grid_a["healthy"]) == (35.0, 90.0, True)
+    assert grid_b["healthy"] is False
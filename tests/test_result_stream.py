@@ -0,0 +1,60 @@
+import json
+import os
+from types import SimpleNamespace
+
+from utils.result_stream import (ATTACHMENTS_DIRECTORY, ResultStreamWriter, _is_xdist_controller, clear_shards, merge,
+                                 store_attachment)
+
+
+def _record(nodeid, outcome, duration, attachments=()):
+    return {"nodeid": nodeid, "file": "tests/test_demo.py", "name": nodeid.split("::")[-1], "worker": "gw0",
+            "outcome": outcome, "start": 100.0, "stop": 100.0 + duration, "duration": duration,
+            "message": None, "trace": None, "attachments": list(attachments), "properties": []}
+
+
+def test_store_attachment_deduplicates_by_content(tmp_path):
+    first = store_attachment(str(tmp_path), b"same bytes", "image/png")
+    second = store_attachment(str(tmp_path), b"same bytes", "image/png")
+    assert first == second
+    assert os.listdir(tmp_path) == [first]
+
+
+def test_merge_streams_shards_into_summary_and_allure(tmp_path):
+    attachments_directory = tmp_path / ATTACHMENTS_DIRECTORY
+    attachments_directory.mkdir()
+    source = store_attachment(str(attachments_directory), "log text", "text/plain")
+    attachment = {"name": "log", "source": source, "type": "text/plain"}
+    shards = {
+        "results-gw0.jsonl": [_record("t::test_a", "passed", 1.0, [attachment]), _record("t::test_b", "failed", 3.0)],
+        "results-gw1.jsonl": [_record("t::test_c", "skipped", 0.1, [attachment])],
+    }
+    for name, records in shards.items():
+        (tmp_path / name).write_text("".join(json.dumps(record) + "\n" for record in records))
+
+    allure_directory = tmp_path / "allure"
+    summary = merge(str(tmp_path), str(tmp_path / "summary.json"), str(allure_directory))
+
+    assert summary["total"] == 3
+    assert summary["outcomes"] == {"passed": 1, "failed": 1, "error": 0, "skipped": 1}
+    assert summary["slowest"][0]["nodeid"] == "t::test_b"
+    assert json.loads((tmp_path / "summary.json").read_text()) == summary
+    results = sorted(allure_directory.glob("*-result.json"))
+    assert len(results) == 3
+    assert len(list(allure_directory.glob("*-attachment.txt"))) == 1
+
+
+def test_only_the_xdist_controller_skips_writing():
+    assert _is_xdist_controller(SimpleNamespace(option=SimpleNamespace(dist="load")))
+    assert not _is_xdist_controller(SimpleNamespace(option=SimpleNamespace(dist="load"), workerinput={}))
+    assert not _is_xdist_controller(SimpleNamespace(option=SimpleNamespace(dist="no")))
+    assert not _is_xdist_controller(SimpleNamespace(option=SimpleNamespace()))
+
+
+def test_a_new_run_replaces_earlier_shards(tmp_path):
+    stale = json.dumps(_record("tests/test_demo.py::test_old", "passed", 1.0)) + "\n"
+    for worker in ("main", "gw3"):
+        (tmp_path / f"results-{worker}.jsonl").write_text(stale)
+    clear_shards(str(tmp_path))
+    ResultStreamWriter(str(tmp_path), "gw0").close()
+    assert sorted(os.listdir(tmp_path)) == [ATTACHMENTS_DIRECTORY, "results-gw0.jsonl"]
+    assert merge(str(tmp_path))["total"] == 0
@@ -0,0 +1,62 @@
+import pytest
+
+from pages.search_results_page import _EXTRACT_PRODUCTS_SCRIPT, _PREFETCH_SCRIPT, SearchResultPage
+
+
+class _SwitchTo:
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    def new_window(self, type_hint):
+        handle = f"tab-{len(self._driver.tabs)}"
+        self._driver.tabs[handle] = "about:blank"
+        self._driver.current_window_handle = handle
+
+    def window(self, handle):
+        assert handle in self._driver.tabs, f"{handle} was closed"
+        self._driver.current_window_handle = handle
+
+
+class _PagedDriver:
+    """
+    Fake driver serving result pages ?p=1..pages, one product per page, in any number of tabs.
+    """
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.tabs = {"origin": "https://shop/search?p=1"}
+        self.current_window_handle = "origin"
+        self.switch_to = _SwitchTo(self)
+
+    @property
+    def current_url(self):
+        return self.tabs[self.current_window_handle]
+
+    def get(self, url):
+        self.tabs[self.current_window_handle] = url
+
+    def close(self):
+        del self.tabs[self.current_window_handle]
+
+    def execute_script(self, script, *args):
+        if script == _EXTRACT_PRODUCTS_SCRIPT:
+            page = int(self.current_url.rsplit("=", 1)[1])
+            next_url = f"https://shop/search?p={page + 1}" if page < self.pages else None
+            return [[[f"Product {page}", f"https://shop/{page}.html", "10", str(page)]], next_url]
+        if script == _PREFETCH_SCRIPT:
+            self.get(args[0])
+            return None
+        return True
+
+
+@pytest.mark.parametrize("max_pages", [1, 2, 3, None])
+def test_walk_ends_in_the_original_tab(max_pages):
+    driver = _PagedDriver(pages=3)
+    pages = list(SearchResultPage(driver, 1).iter_result_pages(max_pages=max_pages))
+
+    walked = max_pages or 3
+    assert [products[0].name for products in pages] == [f"Product {page}" for page in range(1, walked + 1)]
+    assert list(driver.tabs) == ["origin"]
+    assert driver.current_window_handle == "origin"
+    assert driver.current_url == f"https://shop/search?p={walked}"
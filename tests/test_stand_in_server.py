@@ -0,0 +1,39 @@
+import urllib3
+from selenium.webdriver.common.by import By
+
+from pages.search_results_page import SearchResultPage
+from utils.http_driver import HttpDriver
+from utils.stand_in_server import StandInServer
+
+
+def test_search_pages_use_the_storefront_markup():
+    with StandInServer() as server:
+        driver = HttpDriver()
+        driver.get(f"{server.url}catalogsearch/result/?q=shirt")
+        results = SearchResultPage(driver, 5)
+        assert results.has_search_results()
+        assert len(driver.find_elements(*results._product_item)) == 10
+        assert driver.find_elements(*results._next_page_link) == []
+
+        driver.get(f"{server.url}catalogsearch/result/?q=t")
+        next_page = driver.find_element(*results._next_page_link).get_attribute("href")
+        assert next_page == f"{server.url}catalogsearch/result/?q=t&p=2"
+
+        driver.get(f"{server.url}catalogsearch/result/?q=umbrella")
+        assert not SearchResultPage(driver, 5).has_search_results()
+
+
+def test_currency_switch_sets_cookie_and_converts_prices():
+    with StandInServer() as server:
+        http = urllib3.PoolManager()
+        response = http.request("GET", f"{server.url}directory/currency/switch/?currency=EUR&back=/",
+                                redirect=False)
+        assert response.status == 302
+        assert response.headers["Location"] == "/"
+        cookie = response.headers["Set-Cookie"].split(";")[0]
+        page = http.request("GET", f"{server.url}catalogsearch/result/?q=radiant+tee", headers={"Cookie": cookie})
+        driver = HttpDriver(http=http)
+        assert "€20.46" in page.data.decode("utf-8")
+        driver.get(f"{server.url}")
+        assert driver.find_element(By.XPATH, "//a[@data-currency-code='EUR']").get_attribute("href").startswith(
+            f"{server.url}directory/currency/switch/?currency=EUR")
@@ -0,0 +1,49 @@
+import logging
+import sys
+
+from utils import logger as logger_module
+from utils.logger import get_logger
+from utils.startup_profiler import ImportTimer
+
+
+def test_import_timer_separates_self_and_cumulative_time(tmp_path, monkeypatch):
+    package = tmp_path / "profiled_pkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("import time\ntime.sleep(0.02)\nfrom profiled_pkg import child\n")
+    (package / "child.py").write_text("import time\ntime.sleep(0.05)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    timer = ImportTimer()
+    timer.install()
+    try:
+        import profiled_pkg
+    finally:
+        timer.uninstall()
+        for name in ("profiled_pkg", "profiled_pkg.child"):
+            sys.modules.pop(name, None)
+
+    parent_self, parent_cumulative = timer.modules["profiled_pkg"]
+    child_self, child_cumulative = timer.modules["profiled_pkg.child"]
+    assert 0.02 <= parent_self < 0.05
+    assert parent_cumulative >= parent_self + child_cumulative
+    assert child_self >= 0.05
+    assert type(profiled_pkg.__loader__).__name__ != "_TimedLoader"
+    assert timer.slowest(1)[0][0] == "profiled_pkg.child"
+    assert timer.by_package(1)[0][0] == "profiled_pkg"
+
+
+def test_loggers_share_one_lazily_created_file(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(logger_module, "_file_handler", None)
+    first = get_logger("startup.first")
+    second = get_logger("startup.second")
+    get_logger("startup.first")
+    handler, = [handler for handler in first.handlers if isinstance(handler, logging.FileHandler)]
+    try:
+        assert second.handlers == first.handlers == [handler]
+        assert list(tmp_path.iterdir()) == []
+        first.info("first record")
+        assert len(list(tmp_path.glob("test_*.log"))) == 1
+    finally:
+        for logger in (first, second):
+            logger.removeHandler(handler)
+        handler.close()
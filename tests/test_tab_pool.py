@@ -0,0 +1,154 @@
+from types import SimpleNamespace
+
+from utils import tab_pool
+from utils.tab_pool import SharedBrowser, TabMultiplexPlugin, TabScheduler, summarize
+
+MB = 1024 * 1024
+
+
+class _SwitchTo:
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    def new_window(self, type_hint):
+        self._driver.opened += 1
+        handle = f"tab-{self._driver.opened}"
+        self._driver.handles.append(handle)
+        self._driver.current_window_handle = handle
+
+    def window(self, handle):
+        self._driver.current_window_handle = handle
+
+
+class _TabDriver:
+
+    def __init__(self):
+        self.handles = ["home"]
+        self.current_window_handle = "home"
+        self.opened = 0
+        self.urls = {}
+        self.switch_to = _SwitchTo(self)
+
+    @property
+    def window_handles(self):
+        return list(self.handles)
+
+    def execute_script(self, script, *args):
+        if args:
+            self.urls[self.current_window_handle] = args[0]
+        return True
+
+    def close(self):
+        self.handles.remove(self.current_window_handle)
+
+
+def test_preloaded_tabs_are_handed_to_their_tests():
+    driver = _TabDriver()
+    scheduler = TabScheduler(driver, lookahead=2, timeout=1)
+
+    first = scheduler.acquire("test_a", "https://shop/a")
+    scheduler.prefetch("test_b", "https://shop/b")
+    scheduler.prefetch("test_c", "https://shop/c")
+    scheduler.prefetch("test_d", "https://shop/d")  # beyond the lookahead
+    assert driver.current_window_handle == first
+    scheduler.release(first)
+
+    second = scheduler.acquire("test_b", "https://shop/b")
+    assert driver.urls[second] == "https://shop/b"
+    assert driver.current_window_handle == second
+    scheduler.release(second)
+
+    assert driver.handles == ["home", "tab-3"]
+    assert scheduler.tests == 2
+    assert scheduler.preloaded_hits == 1
+    assert scheduler.max_tabs == 3
+
+
+def test_tabs_of_tests_that_do_not_run_are_closed():
+    driver = _TabDriver()
+    scheduler = TabScheduler(driver, lookahead=2, timeout=1)
+
+    first = scheduler.acquire("test_a", "https://shop/a")
+    scheduler.prefetch("test_b", "https://shop/b")  # test_b is then skipped
+    scheduler.release(first)
+
+    second = scheduler.acquire("test_c", "https://shop/c")
+    scheduler.discard_except(["test_d"])
+    scheduler.prefetch("test_d", "https://shop/d")
+    assert driver.current_window_handle == second
+    assert driver.urls[driver.handles[-1]] == "https://shop/d"
+    scheduler.release(second)
+
+    scheduler.close_prepared()
+    assert driver.handles == ["home"]
+    assert driver.current_window_handle == "home"
+
+
+def test_tabs_of_other_workers_are_not_counted():
+    driver = _TabDriver()
+    driver.handles.append("other-worker")
+    opened = []
+    scheduler = TabScheduler(driver, lookahead=1, timeout=1, on_open=opened.append)
+
+    handle = scheduler.acquire("test_a", "https://shop/a")
+    scheduler.prefetch("test_b", "https://shop/b")
+    scheduler.release(handle)
+    assert scheduler.max_tabs == 2
+    assert opened == ["tab-1", "tab-2"], "Each tab is announced before it navigates"
+
+
+class _Controller:
+
+    capabilities = {"goog:chromeOptions": {"debuggerAddress": "localhost:9222"}}
+
+    def __init__(self):
+        self.urls = []
+
+    def get(self, url):
+        self.urls.append(url)
+
+
+def test_workers_attach_to_one_browser_started_by_the_controller(monkeypatch):
+    launched = []
+    monkeypatch.setattr(tab_pool, "launch_shared_chrome", lambda: launched.append(_Controller()) or launched[-1])
+    monkeypatch.setattr(tab_pool, "browser_rss", lambda driver: 300 * MB)
+    options = {"tab_multiplex": True, "record_commands": None, "replay_commands": None}
+    plugin = TabMultiplexPlugin(SimpleNamespace(getoption=options.get))
+
+    nodes = [SimpleNamespace(workerinput={"workerid": f"gw{index}"}) for index in range(3)]
+    for node in nodes:
+        plugin.pytest_configure_node(node)
+    assert len(launched) == 1
+    assert launched[0].urls[-1] == "about:blank", "The controller's own tab does not keep a page alive"
+    assert {node.workerinput["tab_multiplex_browser"] for node in nodes} == {"localhost:9222"}
+
+
+def test_summary_compares_the_shared_browser_with_one_browser_per_worker():
+    shared = SharedBrowser.__new__(SharedBrowser)
+    shared.single_rss, shared.peak_rss = 300 * MB, 500 * MB
+    worker = {"tests": 3, "preloaded_hits": 2, "max_tabs": 2, "baseline_mb": 14.0, "peak_mb": 15.0,
+              "preload_overhead_mb": 1.0}
+    tabs, memory = summarize([worker, dict(worker, max_tabs=3)], shared)
+    assert tabs == "6 tests in tabs on 2 worker(s), 4 preloaded, up to 3 tabs open per worker"
+    assert memory == ("memory: peak 530.0 MB for one Chrome shared by 2 worker(s), incl. 30.0 MB of worker "
+                      "chromedrivers, vs 2 x 300.0 MB = 600.0 MB with one browser per worker")
+
+
+class _Item:
+
+    def __init__(self, nodeid, *markers):
+        self.nodeid = nodeid
+        self._markers = {name: SimpleNamespace(kwargs={}) for name in markers}
+
+    def get_closest_marker(self, name):
+        return self._markers.get(name)
+
+
+def test_only_tests_that_will_run_are_scheduled():
+    plugin = TabMultiplexPlugin(SimpleNamespace())
+    first, skipped, plain, last = (_Item("test_a", "shared_tab"), _Item("test_b", "shared_tab", "skip"),
+                                   _Item("test_c"), _Item("test_d", "shared_tab"))
+    plugin.pytest_collection_finish(SimpleNamespace(items=[first, skipped, plain, last]))
+    assert plugin.upcoming(first) == [last]
+    assert plugin.upcoming(last) == []
@@ -0,0 +1,83 @@
+import pytest
+
+from utils import web_metrics
+
+PAGE_METRICS = {"url": "https://shop.test/search", "ttfb_ms": 212.34, "fcp_ms": 640.0, "lcp_ms": 1210.56,
+                "load_ms": 1800.0, "cls": 0.031234, "resources": 12}
+
+
+class _FakeDriver:
+    """
+    Fake driver whose old document is replaced after two navigation checks.
+    """
+
+    def __init__(self):
+        self.scripts = []
+        self._checks = 0
+
+    def execute_script(self, script, *args):
+        self.scripts.append("mark" if "setAttribute" in script else "check")
+        if "setAttribute" in script:
+            return None
+        self._checks += 1
+        return self._checks > 2
+
+    def execute_async_script(self, script, *args):
+        self.scripts.append("collect")
+        return dict(PAGE_METRICS)
+
+
+@pytest.fixture
+def metrics_enabled():
+    web_metrics.enable()
+    web_metrics.drain()
+    yield
+    web_metrics.drain()
+    web_metrics.enable(False)
+
+
+def test_transition_waits_for_new_document_then_collects_once(metrics_enabled):
+    driver = _FakeDriver()
+    with web_metrics.measure_transition(driver, "search_results", timeout=5):
+        driver.scripts.append("action")
+    assert driver.scripts == ["mark", "action", "check", "check", "check", "collect"]
+    record, = web_metrics.drain()
+    assert record["page_type"] == "search_results"
+    assert (record["ttfb_ms"], record["lcp_ms"], record["cls"]) == (212.3, 1210.6, 0.0312)
+
+
+def test_static_drivers_and_disabled_collection_record_nothing(metrics_enabled):
+    class _StaticDriver(_FakeDriver):
+        is_static = True
+
+    assert web_metrics.record_page(_StaticDriver(), "start_page") is None
+    web_metrics.enable(False)
+    assert web_metrics.record_page(_FakeDriver(), "start_page") is None
+    assert web_metrics.drain() == []
+
+
+def test_budgets_apply_wildcard_and_page_type_limits():
+    budgets = {"*": {"lcp_ms": 1000}, "search_results": {"ttfb_ms": 300}, "start_page": {"lcp_ms": 2000}}
+    records = [{"page_type": "search_results", **PAGE_METRICS}, {"page_type": "start_page", **PAGE_METRICS}]
+    violations = web_metrics.check_budgets(records, budgets)
+    assert len(violations) == 1
+    assert violations[0].startswith("search_results lcp_ms=1210.56 exceeds budget 1000")
+
+
+def test_session_pages_report_budgets_outside_of_tests(metrics_enabled, monkeypatch):
+    monkeypatch.setattr(web_metrics, "_session_violations", [])
+    record = web_metrics.record_session_page(_FakeDriver(), "start_page", budgets={"start_page": {"lcp_ms": 1000}})
+    assert record["lcp_ms"] == 1210.6
+    assert web_metrics.drain() == [], "The first test must not inherit the start page"
+    violation, = web_metrics._session_violations
+    assert violation.startswith("start_page lcp_ms=1210.6 exceeds budget 1000")
+
+
+def test_history_summary_reports_percentiles_per_page_type(tmp_path):
+    path = str(tmp_path / "metrics" / "history.jsonl")
+    web_metrics.append_history(path, [{"page_type": "start_page", "lcp_ms": float(value), "cls": None}
+                                      for value in range(1, 21)])
+    web_metrics.append_history(path, [{"page_type": "search_results", "lcp_ms": 900.0}])
+    summary = web_metrics.summarize(web_metrics.read_history(path), window=10)
+    assert summary["start_page"] == {"samples": 10, "lcp_ms": {"p50": 15.0, "p75": 18.0, "p95": 20.0}}
+    assert summary["search_results"]["lcp_ms"]["p95"] == 900.0
@@ -0,0 +1,220 @@
+# utils/command_replay.py
+"""
+Record and replay of WebDriver command streams.
+
+``--record-commands PATH`` wraps the session driver's command executor and writes every
+WebDriver command, its parameters, the response and the time it took to a gzip-compressed
+JSON Lines file.  ``--replay-commands PATH`` makes ``start_browser`` return a ``ReplayWebDriver``
+instead: the same page-object code receives the recorded responses, in order, without a browser.
+Waits run on a virtual clock that advances by the recorded command durations and poll intervals,
+so a replay runs at CPU speed but times out exactly where the recorded run would have.
+"""
+import gzip
+import json
+import os
+import time
+
+from selenium.webdriver.common.options import ArgOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import wait as wait_module
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+FORMAT_VERSION = 1
+_CONTEXT_COMMANDS = 5
+
+
+def _canonical(params):
+    return json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ReplayMismatchError(AssertionError):
+    """
+    Raised when page-object code issues a command the recording does not have at that position.
+    """
+
+    def __init__(self, position, expected, actual, history):
+        self.position = position
+        self.expected = expected
+        self.actual = actual
+        recent = "\n".join(f"    #{index}: {command} {params}" for index, command, params in history)
+        expected_text = f"{expected[0]} {expected[1]}" if expected else "<end of recording>"
+        super().__init__(
+            f"Command #{position} does not match the recording\n"
+            f"  expected: {expected_text}\n"
+            f"  actual:   {actual[0]} {actual[1]}\n"
+            f"  last matched commands:\n{recent or '    <none>'}")
+
+
+class RecordingExecutor:
+    """
+    Command executor proxy that writes every command and response of a driver to a recording.
+    """
+
+    def __init__(self, executor, path, session_id, capabilities):
+        self._executor = executor
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+        self._write({"version": FORMAT_VERSION, "session_id": session_id, "capabilities": capabilities})
+        self.commands = 0
+
+    def __getattr__(self, name):
+        return getattr(self._executor, name)
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, separators=(",", ":"), default=str))
+        self._file.write("\n")
+
+    def execute(self, command, params):
+        # RemoteConnection.execute removes URL parameters from params, so record them first
+        recorded_params = json.loads(_canonical(params))
+        start = time.perf_counter()
+        response = self._executor.execute(command, params)
+        self._write([command, recorded_params, response, round(time.perf_counter() - start, 6)])
+        self.commands += 1
+        return response
+
+    def close(self):
+        try:
+            self._executor.close()
+        finally:
+            if not self._file.closed:
+                self._file.close()
+
+
+def record_commands(driver, path):
+    """
+    Start recording a driver's command stream to a file.
+
+    Returns:
+        RecordingExecutor: The recording executor now installed on the driver.
+    """
+    recorder = RecordingExecutor(driver.command_executor, path, driver.session_id, driver.caps)
+    driver.command_executor = recorder
+    logger.info(f"Recording WebDriver commands of session {driver.session_id} to {path}")
+    return recorder
+
+
+class VirtualClock:
+    """
+    Stand-in for the time module used by WebDriverWait: sleeping advances the clock instantly.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class ReplayExecutor:
+    """
+    Command executor serving recorded responses in order and rejecting unexpected commands.
+    """
+
+    def __init__(self, path, clock=None):
+        with gzip.open(path, "rt", encoding="utf-8") as recording:
+            header = json.loads(next(recording))
+            if header.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported recording version in {path}: {header.get('version')}")
+            # Responses stay serialized until served, since WebDriver.execute mutates them
+            self._entries = [(command, _canonical(params), json.dumps(response), duration)
+                             for command, params, response, duration in map(json.loads, recording)]
+        self.session_id = header["session_id"]
+        self.capabilities = header["capabilities"]
+        self.position = 0
+        self.mismatch = None
+        self._clock = clock
+
+    @property
+    def remaining(self):
+        return len(self._entries) - self.position
+
+    def execute(self, command, params):
+        # Once the streams diverge every later command is meaningless, so keep reporting the first mismatch
+        if self.mismatch is not None:
+            raise self.mismatch
+        actual = (command, _canonical(params))
+        expected = self._entries[self.position] if self.position < len(self._entries) else None
+        if expected is None or expected[:2] != actual:
+            start = max(0, self.position - _CONTEXT_COMMANDS)
+            history = [(index, entry[0], entry[1]) for index, entry in enumerate(self._entries[start:self.position],
+                                                                                  start)]
+            self.mismatch = ReplayMismatchError(self.position, expected and expected[:2], actual, history)
+            raise self.mismatch
+        self.position += 1
+        if self._clock is not None:
+            self._clock.sleep(expected[3])
+        return json.loads(expected[2])
+
+    def close(self):
+        pass
+
+
+class ReplayWebDriver(WebDriver):
+    """
+    WebDriver that serves a recorded command stream to page objects instead of driving a browser.
+
+    While the driver is open, WebDriverWait runs on its virtual clock; quitting restores real time.
+    """
+
+    def __init__(self, path):
+        self.clock = VirtualClock()
+        self.replay = ReplayExecutor(path, self.clock)
+        wait_module.time = self.clock
+        super().__init__(command_executor=self.replay, options=ArgOptions())
+
+    def start_session(self, capabilities):
+        self.session_id = self.replay.session_id
+        self.caps = self.replay.capabilities
+
+    def stop_client(self):
+        # Restore the time module itself: another replay driver may have saved this one's clock as "real" time
+        if wait_module.time is self.clock:
+            wait_module.time = time
+
+    def assert_replayed(self):
+        """
+        Fail if the replay diverged from the recording or recorded commands were left unused.
+        """
+        if self.replay.mismatch is not None:
+            raise self.replay.mismatch
+        if self.replay.remaining:
+            raise AssertionError(f"{self.replay.remaining} recorded commands were not replayed "
+                                 f"(stopped at #{self.replay.position})")
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("replay", "WebDriver command record and replay")
+    group.addoption("--record-commands", metavar="PATH", default=None,
+                    help="Record WebDriver commands to PATH, one file per browser session and xdist worker.")
+    group.addoption("--replay-commands", metavar="PATH", default=None,
+                    help="Replay the command streams recorded to PATH instead of starting browsers.")
+
+
+def session_path(path, *parts):
+    """
+    Insert name parts before the extensions: session_path("run.jsonl.gz", "start_browser") is
+    "run.start_browser.jsonl.gz".
+    """
+    directory, file_name = os.path.split(path)
+    stem, dot, extension = file_name.partition(".")
+    return os.path.join(directory, ".".join((stem,) + parts) + dot + extension)
+
+
+def recording_path(config, path, session):
+    """
+    Recording path of one browser session: "run.jsonl.gz" becomes "run.start_browser.jsonl.gz" for the
+    start_browser fixture, and "run.start_browser.gw1.jsonl.gz" on xdist worker gw1.
+    """
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is None:
+        return session_path(path, session)
+    return session_path(path, session, workerinput["workerid"])
@@ -1,9 +1,55 @@
 import os
 
 PROJECT_ROOT = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
-PAGE_LOAD_TIME = 30.0,
+PAGE_LOAD_TIME = 30.0
 EXPLICIT_WAIT = 10.0
 BROWSER = "chrome"
 URL = "https://magento.softwaretestingboard.com/"
 BROWSER_PATH = "wd/chromedriver"
 IMAGE_PATH = os.path.join(PROJECT_ROOT, 'resx/images')
+
+# Test impact analysis
+IMPACT_MAP_PATH = os.path.join(PROJECT_ROOT, '.impact', 'test_map.json')
+IMPACT_WATCHED_FILES = ('conftest.py', 'pytest.ini', 'requirements.txt', 'utils/*.py')
+
+# Remote / grid execution (set BROWSER = "remote" to use it)
+GRID_HOSTS = [host.strip() for host in os.environ.get('GRID_HOSTS', 'http://127.0.0.1:4444').split(',') if host.strip()]
+GRID_BROWSER = "chrome"
+GRID_POOL_MAXSIZE = 4
+GRID_CONNECT_TIMEOUT = 5.0
+GRID_READ_TIMEOUT = 120.0
+GRID_HEALTH_TIMEOUT = 2.0
+GRID_HEALTH_TTL = 30.0
+
+# Browserless HTTP backend
+HTTP_POOL_MAXSIZE = 10
+HTTP_TIMEOUT = 10.0
+HTTP_USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) selenium-pytest-automation"
+
+# Console and JavaScript error capture
+CONSOLE_BUFFER_SIZE = 1000
+CONSOLE_MAX_TEXT = 2000
+CONSOLE_START_TIMEOUT = 10.0
+
+# Multi-tab session multiplexing
+TAB_LOOKAHEAD = 2
+
+# Web performance metrics (budgets per page type, "*" applies to all; timings in milliseconds)
+WEB_METRICS_HISTORY_PATH = os.path.join(PROJECT_ROOT, '.metrics', 'web_metrics.jsonl')
+WEB_METRICS_HISTORY_WINDOW = 200
+WEB_METRICS_SETTLE_MS = 250
+PERF_BUDGETS = {
+    "*": {"lcp_ms": 4000, "cls": 0.25},
+    "search_results": {"ttfb_ms": 1800},
+}
+
+# Synthetic load mode and the local stand-in storefront
+STAND_IN_PAGE_SIZE = 12
+LOAD_USERS = 4
+LOAD_RAMP_UP = 10.0
+LOAD_DURATION = 60.0
+LOAD_THINK_TIME = 1.0
+LOAD_WINDOW_SIZE = "1366,768"
+
+# Collection and startup profiler
+STARTUP_PROFILE_TOP = 15
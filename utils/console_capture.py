@@ -0,0 +1,389 @@
+# utils/console_capture.py
+"""
+Event-streamed console and JavaScript error capture.
+
+A ``ConsoleCollector`` subscribes to the DevTools ``Runtime.consoleAPICalled`` and
+``Runtime.exceptionThrown`` events of a Chromium based session over Selenium's CDP connection.
+Browser-level ``Target.setAutoAttach`` attaches it to the first tab and to every tab or window
+opened later (shared-tab tests, result page prefetching); new tabs wait until the subscription is
+active, so no early error is missed.  In a browser shared by several xdist workers, auto-attach would
+also catch the other workers' tabs, so there each tab the worker opens is attached explicitly instead.  Events are received on a background thread and kept in a
+bounded buffer, so checking for JavaScript errors costs no WebDriver round trip on the test's
+critical path.
+"""
+import re
+import threading
+from collections import deque
+from typing import NamedTuple, Optional
+
+import pytest
+
+from utils.config import CONSOLE_BUFFER_SIZE, CONSOLE_MAX_TEXT, CONSOLE_START_TIMEOUT
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_collectors = {}
+_error_levels = ("error", "assert")
+
+
+class ConsoleEvent(NamedTuple):
+    """
+    A console message or uncaught exception reported by the page.
+    """
+    seq: int
+    kind: str
+    level: str
+    text: str
+    url: Optional[str]
+    timestamp: float
+
+
+class ConsoleCollector:
+    """
+    Buffers console and exception events of one browser session on a background thread.
+    """
+
+    def __init__(self, max_events=CONSOLE_BUFFER_SIZE, max_text=CONSOLE_MAX_TEXT):
+        self._events = deque(maxlen=max_events)
+        self._max_text = max_text
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._ready = threading.Event()
+        self._thread = None
+        self._token = None
+        self._cancel_scope = None
+        self._auto_attach = True
+        self._connection = None
+        self._devtools = None
+        self._enabled = {}
+        self.error = None
+
+    @property
+    def dropped(self):
+        """
+        Number of events evicted from the buffer because it was full.
+        """
+        with self._lock:
+            return self._seq - len(self._events)
+
+    def start(self, driver, timeout=CONSOLE_START_TIMEOUT, auto_attach=True):
+        """
+        Start listening on a background thread and wait until the subscription is active.
+
+        Args:
+            driver (WebDriver): Session to capture.
+            timeout (float): Seconds to wait for the subscription.
+            auto_attach (bool): Capture every tab of the browser; if False, only tabs added with ``watch``.
+
+        Returns:
+            bool: True if the collector is listening, False if the session does not support it.
+        """
+        caps = driver.caps or {}
+        if "se:cdp" not in caps and caps.get("browserName") not in ("chrome", "chrome-headless-shell", "MicrosoftEdge"):
+            logger.info(f"Console capture is not supported for {caps.get('browserName')}")
+            return False
+        import trio  # Imported on first use so that collection does not pay for it
+
+        self._auto_attach = auto_attach
+        self._thread = threading.Thread(target=trio.run, args=(self._listen, driver), name="console-capture",
+                                        daemon=True)
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            logger.error(f"Console capture did not start within {timeout} seconds: {self.error}")
+            return False
+        return self.error is None
+
+    def stop(self, timeout=5):
+        if self._token is not None and self._cancel_scope is not None:
+            import trio
+
+            try:
+                trio.from_thread.run_sync(self._cancel_scope.cancel, trio_token=self._token)
+            except trio.RunFinishedError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    async def _listen(self, driver):
+        import trio
+        from selenium.webdriver.common.bidi import cdp
+
+        self._token = trio.lowlevel.current_trio_token()
+        with trio.CancelScope() as self._cancel_scope:
+            try:
+                version, ws_url = _cdp_endpoint(driver)
+                devtools = cdp.import_devtools(version)
+                async with cdp.open_cdp(ws_url) as connection, trio.open_nursery() as nursery:
+                    targets = connection.listen(devtools.target.AttachedToTarget, devtools.target.DetachedFromTarget,
+                                                buffer_size=CONSOLE_BUFFER_SIZE)
+                    self._connection, self._devtools = connection, devtools
+                    if self._auto_attach:
+                        # On the browser connection this covers the existing tab and every tab opened later
+                        await connection.execute(devtools.target.set_auto_attach(
+                            auto_attach=True, wait_for_debugger_on_start=True, flatten=True))
+                    else:
+                        self._ready.set()
+                    async for event in targets:
+                        if isinstance(event, devtools.target.DetachedFromTarget):
+                            _detach(connection, event.session_id)
+                            continue
+                        session = cdp.CdpSession(connection.ws, event.session_id, event.target_info.target_id)
+                        connection.sessions[event.session_id] = session
+                        # Started as tasks so that this loop keeps handling detaches while they wait for replies
+                        if event.target_info.type_ == "page":
+                            nursery.start_soon(self._listen_target, session, devtools)
+                        else:
+                            nursery.start_soon(_resume, session, devtools)
+            except Exception as e:
+                self.error = e
+                logger.error(f"Console capture stopped: {e}")
+            finally:
+                self._ready.set()
+
+    async def _listen_target(self, session, devtools):
+        events = session.listen(devtools.runtime.ConsoleAPICalled, devtools.runtime.ExceptionThrown,
+                                buffer_size=CONSOLE_BUFFER_SIZE)
+        try:
+            await session.execute(devtools.runtime.enable())
+        except Exception as e:  # The tab closed while it was being attached
+            logger.info(f"Console capture could not attach to target {session.target_id}: {e}")
+        await _resume(session, devtools)
+        self._ready.set()
+        enabled = self._enabled.pop(session.target_id, None)
+        if enabled is not None:
+            enabled.set()
+        async for event in events:
+            if isinstance(event, devtools.runtime.ExceptionThrown):
+                self._on_exception(event)
+            else:
+                self._on_console(event)
+
+    def watch(self, target_id, timeout=CONSOLE_START_TIMEOUT):
+        """
+        Start capturing one more tab, for collectors started without auto-attach.
+
+        Returns:
+            bool: True once the tab's events are subscribed.
+        """
+        if self._token is None or self._connection is None:
+            return False
+        import trio
+
+        try:
+            return trio.from_thread.run(self._watch, target_id, timeout, trio_token=self._token)
+        except trio.RunFinishedError:
+            return False
+
+    async def _watch(self, target_id, timeout):
+        import trio
+
+        enabled = self._enabled[target_id] = trio.Event()
+        # The attachedToTarget event this triggers is handled by the listening loop like an auto-attached tab
+        await self._connection.execute(self._devtools.target.attach_to_target(
+            self._devtools.target.TargetID(target_id), flatten=True))
+        with trio.move_on_after(timeout):
+            await enabled.wait()
+        return enabled.is_set()
+
+    def _append(self, kind, level, text, url, timestamp):
+        with self._lock:
+            self._seq += 1
+            self._events.append(ConsoleEvent(self._seq, kind, level, text[:self._max_text], url, timestamp))
+
+    def _on_console(self, event):
+        text = " ".join(str(arg.value if arg.value is not None else arg.description or "") for arg in event.args)
+        frames = event.stack_trace.call_frames if event.stack_trace else None
+        self._append("console", event.type_, text, frames[0].url if frames else None, float(event.timestamp))
+
+    def _on_exception(self, event):
+        details = event.exception_details
+        description = details.exception.description if details.exception else None
+        self._append("exception", "error", description or details.text, details.url, float(event.timestamp))
+
+    def mark(self):
+        """
+        Return the sequence number of the latest event, to select events that happen afterwards.
+        """
+        with self._lock:
+            return self._seq
+
+    def events(self, since=0, level=None, kind=None, pattern=None):
+        """
+        Return buffered events, optionally filtered.
+
+        Args:
+            since (int): Only events after this mark (default 0, all buffered events).
+            level (str or tuple): Console level(s) to keep, e.g. "error" or ("error", "warning").
+            kind (str): "console" or "exception".
+            pattern (str): Regular expression the event text must match.
+
+        Returns:
+            list: Matching ConsoleEvent records in arrival order.
+        """
+        levels = (level,) if isinstance(level, str) else level
+        regex = re.compile(pattern) if pattern else None
+        with self._lock:
+            events = [event for event in self._events if event.seq > since]
+        return [event for event in events
+                if (levels is None or event.level in levels)
+                and (kind is None or event.kind == kind)
+                and (regex is None or regex.search(event.text))]
+
+    def errors(self, since=0, ignore=()):
+        """
+        Return console errors and uncaught exceptions, skipping texts matching any ignore pattern.
+        """
+        ignored = [re.compile(pattern) for pattern in ignore]
+        return [event for event in self.events(since, level=_error_levels)
+                if not any(regex.search(event.text) for regex in ignored)]
+
+    def assert_no_errors(self, since=0, ignore=()):
+        """
+        Fail if the page logged console errors or threw uncaught exceptions.
+
+        Raises:
+            AssertionError: Listing the offending events.
+        """
+        errors = self.errors(since, ignore)
+        if errors:
+            lines = "\n".join(f"  [{event.kind}:{event.level}] {event.text} ({event.url})" for event in errors)
+            raise AssertionError(f"{len(errors)} JavaScript error(s) on the page:\n{lines}")
+
+
+def _cdp_endpoint(driver):
+    """
+    Return the (protocol version, browser WebSocket URL) of a session, as WebDriver.bidi_connection finds them.
+    """
+    caps = driver.caps
+    if caps.get("se:cdp"):
+        return caps["se:cdpVersion"].split(".")[0], caps["se:cdp"]
+    return driver._get_cdp_details()
+
+
+async def _resume(session, devtools):
+    # Auto-attached targets wait for the debugger until told to run
+    try:
+        await session.execute(devtools.runtime.run_if_waiting_for_debugger())
+    except Exception as e:
+        logger.info(f"Could not resume target {session.target_id}: {e}")
+
+
+def _detach(connection, session_id):
+    # Once the tab is gone its pending commands get no reply; failing them and closing the channels ends its tasks
+    session = connection.sessions.pop(session_id, None)
+    if session is None:
+        return
+    for command_id, (_, done) in list(session.inflight_cmd.items()):
+        session.inflight_result[command_id] = ConnectionError(f"Target {session.target_id} detached")
+        done.set()
+    session.inflight_cmd.clear()
+    for senders in session.channels.values():
+        for sender in senders:
+            sender.close()
+
+
+class ConsoleLog:
+    """
+    Per-test view on a collector, limited to events that arrived after the test started.
+    """
+
+    def __init__(self, collector):
+        self._collector = collector
+        self.since = collector.mark()
+
+    def events(self, level=None, kind=None, pattern=None):
+        return self._collector.events(self.since, level=level, kind=kind, pattern=pattern)
+
+    def errors(self, ignore=()):
+        return self._collector.errors(self.since, ignore)
+
+    def assert_no_errors(self, ignore=()):
+        self._collector.assert_no_errors(self.since, ignore)
+
+
+def start_collector(driver, auto_attach=True):
+    """
+    Start capturing console events for a driver. Does nothing if the browser does not support it.
+
+    Args:
+        driver (WebDriver): Session to capture.
+        auto_attach (bool): Capture every tab of the browser; False for a browser shared with other workers,
+            whose own tabs are then added with ``watch_target``.
+
+    Returns:
+        ConsoleCollector: The collector (it stays empty if capture could not start).
+    """
+    collector = ConsoleCollector()
+    if collector.start(driver, auto_attach=auto_attach):
+        logger.info(f"Capturing console events for session {driver.session_id}")
+    _collectors[driver.session_id] = collector
+    return collector
+
+
+def get_collector(driver):
+    """
+    Return the collector started for a driver, or None.
+    """
+    return _collectors.get(getattr(driver, "session_id", None))
+
+
+def watch_target(driver, handle):
+    """
+    Capture the console events of one tab of a driver whose collector does not auto-attach.
+
+    Chromium window handles are DevTools target ids, so the handle identifies the tab's target.
+    """
+    collector = get_collector(driver)
+    if collector is not None and not collector.watch(handle):
+        logger.info(f"Console capture could not watch tab {handle}")
+
+
+def stop_collector(driver):
+    collector = _collectors.pop(getattr(driver, "session_id", None), None)
+    if collector is not None:
+        collector.stop()
+
+
+# Driver fixtures in order of preference: a test's tab or page driver wraps the session browser
+_DRIVER_FIXTURES = ("tab_browser", "page_driver", "start_browser")
+
+
+def _driver_under_test(request):
+    """
+    Return the driver the requesting test uses, falling back to the session browser.
+    """
+    name = next((name for name in _DRIVER_FIXTURES if name in request.fixturenames), "start_browser")
+    return request.getfixturevalue(name)
+
+
+@pytest.fixture
+def console_log(request):
+    """
+    Fixture exposing the console events and JavaScript errors raised while the test runs.
+
+    The collector is the one of the driver the test uses (``tab_browser``, ``page_driver`` or ``start_browser``);
+    browserless drivers have no console, so their log stays empty.
+
+    Returns:
+        ConsoleLog: Filtering and assertion helpers for this test's events.
+    """
+    collector = get_collector(_driver_under_test(request)) or ConsoleCollector()
+    return ConsoleLog(collector)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("console", "console and JavaScript error capture")
+    group.addoption("--fail-on-js-errors", action="store_true", default=False,
+                    help="Fail tests whose pages log console errors or throw uncaught exceptions.")
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    if not item.config.getoption("fail_on_js_errors") or not _collectors:
+        return (yield)
+    marks = {collector: collector.mark() for collector in _collectors.values()}
+    result = yield
+    for collector, since in marks.items():
+        collector.assert_no_errors(since)
+    return result
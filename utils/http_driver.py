@@ -0,0 +1,206 @@
+# utils/http_driver.py
+"""
+Browserless HTTP + DOM backend for page objects.
+
+``HttpDriver`` fetches server-rendered HTML through a pooled urllib3 client, parses it with lxml and
+answers the read-only part of the WebDriver API that ``BasePage`` relies on (``find_element(s)``,
+``title``, element ``text`` and ``get_attribute``).  Page objects run against it unchanged, which makes
+checks that only need the server-rendered markup take milliseconds instead of a browser session.
+No JavaScript runs, so elements added by scripts are not found; ``execute_script`` raises ``BrowserRequired``.
+"""
+import re
+from functools import lru_cache
+from urllib.parse import urljoin
+
+import urllib3
+from cssselect import HTMLTranslator, SelectorError
+from lxml import etree, html
+from selenium.common import InvalidSelectorException, NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+
+from utils.config import HTTP_POOL_MAXSIZE, HTTP_TIMEOUT, HTTP_USER_AGENT
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_http = None
+_translator = HTMLTranslator()
+_whitespace = re.compile(r"\s+")
+_url_attributes = ("href", "src", "action")
+_boolean_attributes = ("checked", "disabled", "selected", "readonly", "required", "multiple", "hidden")
+_visible_text = etree.XPath(
+    "descendant-or-self::text()[not(ancestor::script or ancestor::style or ancestor::noscript or ancestor::template)]")
+
+
+class BrowserRequired(WebDriverException):
+    """
+    Raised when a page or an operation needs a real browser (JavaScript, non-HTML content, HTTP errors).
+    """
+
+
+def get_http_pool():
+    """
+    Return the process-wide urllib3 pool shared by all HttpDriver instances.
+    """
+    global _http
+    if _http is None:
+        _http = urllib3.PoolManager(maxsize=HTTP_POOL_MAXSIZE, timeout=HTTP_TIMEOUT,
+                                    headers={"User-Agent": HTTP_USER_AGENT})
+    return _http
+
+
+@lru_cache(maxsize=512)
+def compile_locator(by, value):
+    """
+    Compile a Selenium locator (ID, CSS, XPath, name, class name, tag name, link text) into an lxml XPath.
+
+    Raises:
+        InvalidSelectorException: If the strategy is unsupported or the selector is invalid.
+    """
+    literal = _translator.xpath_literal
+    try:
+        if by == By.XPATH:
+            expression = value
+        elif by == By.CSS_SELECTOR:
+            expression = _translator.css_to_xpath(value, prefix="descendant::")
+        elif by == By.ID:
+            expression = f"descendant::*[@id = {literal(value)}]"
+        elif by == By.NAME:
+            expression = f"descendant::*[@name = {literal(value)}]"
+        elif by == By.CLASS_NAME:
+            expression = f"descendant::*[contains(concat(' ', normalize-space(@class), ' '), {literal(f' {value} ')})]"
+        elif by == By.TAG_NAME:
+            expression = f"descendant::{value.lower()}"
+        elif by == By.LINK_TEXT:
+            expression = f"descendant::a[normalize-space(.) = {literal(value.strip())}]"
+        elif by == By.PARTIAL_LINK_TEXT:
+            expression = f"descendant::a[contains(., {literal(value)})]"
+        else:
+            raise InvalidSelectorException(f"Locator strategy '{by}' is not supported without a browser")
+        return etree.XPath(expression)
+    except (SelectorError, etree.XPathSyntaxError) as e:
+        raise InvalidSelectorException(f"Invalid selector {(by, value)}: {e}")
+
+
+def _find_all(context, base_url, by, value):
+    return [HttpElement(node, base_url) for node in compile_locator(by, value)(context)
+            if isinstance(node, html.HtmlElement)]
+
+
+class HttpElement:
+    """
+    Read-only stand-in for a WebElement backed by an lxml node.
+    """
+
+    def __init__(self, node, base_url):
+        self._node = node
+        self._base_url = base_url
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        return _whitespace.sub(" ", "".join(_visible_text(self._node))).strip()
+
+    def get_attribute(self, name):
+        """
+        Return an attribute the way Selenium does: URLs resolved, boolean attributes as "true", None when absent.
+        """
+        if name == "innerHTML":
+            return (self._node.text or "") + "".join(
+                etree.tostring(child, encoding="unicode", method="html") for child in self._node)
+        if name == "outerHTML":
+            return etree.tostring(self._node, encoding="unicode", method="html", with_tail=False)
+        if name in ("textContent", "innerText"):
+            return self._node.text_content() if name == "textContent" else self.text
+        value = self._node.get(name)
+        if value is None:
+            return None
+        if name in _boolean_attributes:
+            return "true"
+        if name in _url_attributes:
+            return urljoin(self._base_url, value)
+        return value
+
+    def get_dom_attribute(self, name):
+        return self._node.get(name)
+
+    def is_displayed(self):
+        for node in [self._node, *self._node.iterancestors()]:
+            style = _whitespace.sub("", node.get("style", "")).lower()
+            if node.get("hidden") is not None or "display:none" in style or "visibility:hidden" in style:
+                return False
+        return True
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {(by, value)}")
+        return elements[0]
+
+    def find_elements(self, by=By.ID, value=None):
+        return _find_all(self._node, self._base_url, by, value)
+
+
+class HttpDriver:
+    """
+    Browserless driver exposing the read-only WebDriver subset used by BasePage.
+
+    Waits are pointless on a static document, so BasePage looks elements up once when ``is_static`` is set.
+    """
+
+    is_static = True
+
+    def __init__(self, http=None):
+        self._http = http or get_http_pool()
+        self._document = None
+        self._source = ""
+        self.current_url = None
+
+    def get(self, url):
+        """
+        Fetch and parse a page.
+
+        Raises:
+            BrowserRequired: If the response is an HTTP error or not HTML.
+        """
+        response = self._http.request("GET", url)
+        content_type = response.headers.get("Content-Type", "")
+        if response.status >= 400:
+            raise BrowserRequired(f"GET {url} returned HTTP {response.status}")
+        if "html" not in content_type:
+            raise BrowserRequired(f"GET {url} returned non-HTML content: {content_type}")
+        self.current_url = urljoin(url, response.url) if response.url else url
+        self._source = response.data.decode("utf-8", errors="replace")
+        self._document = html.document_fromstring(response.data, base_url=self.current_url)
+        logger.info(f"Fetched {self.current_url} without a browser ({len(response.data)} bytes)")
+
+    @property
+    def title(self):
+        return _whitespace.sub(" ", self._document.findtext(".//title") or "").strip()
+
+    @property
+    def page_source(self):
+        return self._source
+
+    def find_element(self, by=By.ID, value=None):
+        elements = self.find_elements(by, value)
+        if not elements:
+            raise NoSuchElementException(f"Unable to locate element: {(by, value)}")
+        return elements[0]
+
+    def find_elements(self, by=By.ID, value=None):
+        if self._document is None:
+            raise WebDriverException("No page loaded; call get(url) first")
+        return _find_all(self._document.getroottree(), self.current_url, by, value)
+
+    def execute_script(self, script, *args):
+        raise BrowserRequired("JavaScript execution needs a real browser; mark the test browserless(js=True)")
+
+    def close(self):
+        self._document = None
+
+    def quit(self):
+        self._document = None
@@ -0,0 +1,413 @@
+# utils/impact_analysis.py
+"""
+Runtime-recorded test impact analysis.
+
+Record mode (``--impact-record``) profiles each test while it runs and stores which
+page classes, methods and locators it exercised through the page objects, together
+with a digest of every symbol's source.  Select mode (``--impact-select``) re-digests
+the same symbols from the working tree and deselects tests whose symbols are all
+unchanged.  The full suite runs whenever the mapping is missing or stale.
+"""
+import ast
+import glob
+import hashlib
+import inspect
+import json
+import os
+import sys
+import types
+
+import pytest
+
+from utils.config import IMPACT_MAP_PATH, IMPACT_WATCHED_FILES, PROJECT_ROOT
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+MAP_VERSION = 1
+MODULE_SYMBOL = "<module>"
+PAGES_DIRECTORY = os.path.join(PROJECT_ROOT, "pages")
+
+
+def _digest(text):
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+def module_symbols(path):
+    """
+    Digest every top-level symbol of a Python source file.
+
+    Digests are taken over the AST, so formatting and comment changes do not count as changes.
+
+    Args:
+        path (str): Path to the Python source file.
+
+    Returns:
+        dict: Mapping of symbol name ("func", "Class", "Class.member" or "<module>") to digest.
+    """
+    with open(path, encoding="utf-8") as source_file:
+        tree = ast.parse(source_file.read(), filename=path)
+
+    symbols = {}
+    module_rest = []
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols[node.name] = _digest(ast.dump(node))
+        elif isinstance(node, ast.ClassDef):
+            class_rest = [ast.dump(base) for base in node.bases] + [ast.dump(dec) for dec in node.decorator_list]
+            for member in node.body:
+                if isinstance(member, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    symbols[f"{node.name}.{member.name}"] = _digest(ast.dump(member))
+                elif isinstance(member, ast.Assign) and all(isinstance(t, ast.Name) for t in member.targets):
+                    for target in member.targets:
+                        symbols[f"{node.name}.{target.id}"] = _digest(ast.dump(member.value))
+                else:
+                    class_rest.append(ast.dump(member))
+            symbols[node.name] = _digest("\n".join(class_rest))
+        else:
+            module_rest.append(ast.dump(node))
+    symbols[MODULE_SYMBOL] = _digest("\n".join(module_rest))
+    return symbols
+
+
+def code_symbols(module):
+    """
+    Map the code objects of a module's functions to the top-level symbols ``module_symbols`` digests.
+
+    Nested functions and lambdas map to the function they are defined in, so a call anywhere in a
+    method is recorded against that method, whatever the Python version's ``co_qualname`` support.
+
+    Args:
+        module (module): An imported module.
+
+    Returns:
+        dict: Mapping of code object to symbol name ("func" or "Class.member").
+    """
+    symbols = {}
+    filename = getattr(module, "__file__", None)
+
+    def add(code, symbol):
+        symbols[code] = symbol
+        for constant in code.co_consts:
+            if isinstance(constant, types.CodeType):
+                add(constant, symbol)
+
+    def functions(member):
+        if isinstance(member, (staticmethod, classmethod)):
+            member = member.__func__
+        if isinstance(member, property):
+            return [function for accessor in (member.fget, member.fset, member.fdel) if accessor is not None
+                    for function in functions(accessor)]
+        member = inspect.unwrap(member)
+        # Generated members (e.g. NamedTuple's) are compiled elsewhere and have no digest in this module
+        return [member] if inspect.isfunction(member) and member.__code__.co_filename == filename else []
+
+    for name, value in vars(module).items():
+        if getattr(value, "__module__", None) != module.__name__ or getattr(value, "__name__", None) != name:
+            continue
+        if inspect.isclass(value):
+            for member_name, member in vars(value).items():
+                for function in functions(member):
+                    add(function.__code__, f"{name}.{member_name}")
+        else:
+            for function in functions(value):
+                add(function.__code__, name)
+    return symbols
+
+
+def environment_digest(patterns=IMPACT_WATCHED_FILES):
+    """
+    Digest the files whose change invalidates the whole mapping (fixtures, config, utils).
+
+    Args:
+        patterns (tuple): Glob patterns relative to the project root.
+
+    Returns:
+        str: Combined digest of the matching files' contents.
+    """
+    hasher = hashlib.sha1()
+    for pattern in patterns:
+        for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, pattern))):
+            hasher.update(os.path.relpath(path, PROJECT_ROOT).encode("utf-8"))
+            with open(path, "rb") as watched_file:
+                hasher.update(watched_file.read())
+    return hasher.hexdigest()[:16]
+
+
+class SymbolIndex:
+    """
+    Lazily computed symbol digests for files in the working tree.
+    """
+
+    def __init__(self, root=PROJECT_ROOT):
+        self._root = root
+        self._files = {}
+
+    def digest(self, key):
+        """
+        Return the current digest of a "relative/path.py::Symbol" key, or None if it no longer exists.
+        """
+        relative_path, _, symbol = key.partition("::")
+        if relative_path not in self._files:
+            path = os.path.join(self._root, relative_path)
+            try:
+                self._files[relative_path] = module_symbols(path)
+            except (OSError, SyntaxError):
+                self._files[relative_path] = {}
+        return self._files[relative_path].get(symbol)
+
+
+def load_map(path):
+    """
+    Load an impact map from disk.
+
+    Returns:
+        dict or None: The mapping, or None if it is missing or unreadable.
+    """
+    try:
+        with open(path, encoding="utf-8") as map_file:
+            return json.load(map_file)
+    except (OSError, ValueError):
+        return None
+
+
+def stale_reason(impact_map, environment):
+    """
+    Explain why an impact map cannot be used for selection.
+
+    Returns:
+        str or None: The reason the mapping is stale, or None if it is usable.
+    """
+    if impact_map is None:
+        return "no impact map recorded yet"
+    if impact_map.get("version") != MAP_VERSION:
+        return "impact map was written by a different version"
+    if impact_map.get("environment") != environment:
+        return "fixtures, config or utils changed since the map was recorded"
+    return None
+
+
+def affected_tests(nodeids, impact_map, index=None):
+    """
+    Determine which tests need to run given the recorded mapping and the working tree.
+
+    Args:
+        nodeids (iterable): Collected test node ids.
+        impact_map (dict): Previously recorded mapping.
+        index (SymbolIndex): Digest source for the working tree (default: project root).
+
+    Returns:
+        set: Node ids that are new or touch at least one changed symbol.
+    """
+    index = index or SymbolIndex()
+    recorded = impact_map.get("tests", {})
+    affected = set()
+    for nodeid in nodeids:
+        entry = recorded.get(nodeid)
+        if entry is None:
+            affected.add(nodeid)
+            continue
+        for key, digest in entry["symbols"].items():
+            # A symbol that could not be digested when recording cannot be shown to be unchanged
+            if digest is None or index.digest(key) != digest:
+                affected.add(nodeid)
+                break
+    return affected
+
+
+class ImpactRecorder:
+    """
+    Profiles test calls and collects the page-object symbols each test touches.
+    """
+
+    def __init__(self, pages_directory=PAGES_DIRECTORY, root=PROJECT_ROOT):
+        self._pages_directory = os.path.normcase(os.path.abspath(pages_directory)) + os.sep
+        self._root = root
+        self._relative_paths = {}
+        self._locator_index = {}
+        self._code_index = {}
+        self._touched = None
+
+    def _relative_path(self, filename):
+        try:
+            return self._relative_paths[filename]
+        except KeyError:
+            path = os.path.normcase(os.path.abspath(filename))
+            relative = None
+            if path.startswith(self._pages_directory):
+                relative = os.path.relpath(path, self._root).replace(os.sep, "/")
+            self._relative_paths[filename] = relative
+            return relative
+
+    def _locators_for(self, page_class):
+        try:
+            return self._locator_index[page_class]
+        except KeyError:
+            locators = {}
+            for klass in reversed(page_class.__mro__):
+                module = sys.modules.get(klass.__module__)
+                relative = self._relative_path(getattr(module, "__file__", None) or "")
+                if relative is None:
+                    continue
+                members = vars(klass)
+                declarations = members.get("_element_declarations", {})
+                for name, value in members.items():
+                    if isinstance(value, tuple) and len(value) == 2 and all(isinstance(v, str) for v in value):
+                        # "_<name>" tuples published for Element declarations are keyed by the declaration below,
+                        # the symbol the source digests see
+                        element = declarations.get(name[1:]) if name.startswith("_") else None
+                        if element is None or element.locator != value:
+                            locators[value] = f"{relative}::{klass.__name__}.{name}"
+                for name, element in declarations.items():
+                    if members.get(name) is element:
+                        locators[element.locator] = f"{relative}::{klass.__name__}.{name}"
+            self._locator_index[page_class] = locators
+            return locators
+
+    def _symbol_for(self, frame):
+        module_name = frame.f_globals.get("__name__")
+        try:
+            symbols = self._code_index[module_name]
+        except KeyError:
+            module = sys.modules.get(module_name)
+            symbols = self._code_index[module_name] = code_symbols(module) if module is not None else {}
+        return symbols.get(frame.f_code, MODULE_SYMBOL)
+
+    def _profile(self, frame, event, arg):
+        if event != "call":
+            return
+        code = frame.f_code
+        relative = self._relative_path(code.co_filename)
+        if relative is None:
+            return
+        self._touched.add(f"{relative}::{self._symbol_for(frame)}")
+        local_vars = frame.f_locals
+        page = local_vars.get("self")
+        if page is None:
+            return
+        locators = self._locators_for(type(page))
+        for value in local_vars.values():
+            if isinstance(value, tuple):
+                symbol = locators.get(value)
+                if symbol:
+                    self._touched.add(symbol)
+            elif isinstance(value, list):
+                for item in value:
+                    symbol = locators.get(item) if isinstance(item, tuple) else None
+                    if symbol:
+                        self._touched.add(symbol)
+
+    def start(self):
+        self._touched = set()
+        sys.setprofile(self._profile)
+
+    def stop(self):
+        sys.setprofile(None)
+        touched, self._touched = self._touched, None
+        return touched
+
+
+class ImpactAnalysisPlugin:
+    """
+    Pytest plugin implementing the record and select modes.
+    """
+
+    def __init__(self, config, record, select, map_path):
+        self._config = config
+        self._record = record
+        self._select = select
+        self._map_path = map_path
+        self._environment = environment_digest()
+        self._recorder = ImpactRecorder() if record else None
+        self._index = SymbolIndex()
+        self._tests = {}
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, config, items):
+        if not self._select:
+            return
+        impact_map = load_map(self._map_path)
+        reason = stale_reason(impact_map, self._environment)
+        if reason:
+            self._report(f"impact analysis: running full suite ({reason})")
+            return
+        affected = affected_tests([item.nodeid for item in items], impact_map, self._index)
+        selected = [item for item in items if item.nodeid in affected]
+        deselected = [item for item in items if item.nodeid not in affected]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        self._report(f"impact analysis: {len(selected)} affected, {len(deselected)} deselected")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        if not self._record:
+            yield
+            return
+        self._recorder.start()
+        try:
+            yield
+        finally:
+            touched = self._recorder.stop()
+            self._tests[item.nodeid] = self._entry(item, touched)
+
+    def _entry(self, item, touched):
+        test_file = os.path.relpath(str(item.path), PROJECT_ROOT).replace(os.sep, "/")
+        function_name = getattr(item, "originalname", item.name)
+        keys = {f"{test_file}::{MODULE_SYMBOL}", f"{test_file}::{function_name}"} | touched
+        for key in list(touched):
+            relative_path = key.partition("::")[0]
+            keys.add(f"{relative_path}::{MODULE_SYMBOL}")
+        return {"symbols": {key: self._index.digest(key) for key in sorted(keys)}}
+
+    def pytest_sessionfinish(self, session):
+        if not self._record:
+            return
+        workerinput = getattr(self._config, "workerinput", None)
+        if workerinput is not None:
+            shard = {"version": MAP_VERSION, "environment": self._environment, "tests": self._tests}
+            self._write(f"{self._map_path}.{workerinput['workerid']}", shard)
+            return
+
+        impact_map = load_map(self._map_path)
+        if stale_reason(impact_map, self._environment):
+            impact_map = {"version": MAP_VERSION, "environment": self._environment, "tests": {}}
+        impact_map["tests"].update(self._tests)
+        for shard_path in glob.glob(f"{glob.escape(self._map_path)}.gw*"):
+            shard = load_map(shard_path) or {}
+            impact_map["tests"].update(shard.get("tests", {}))
+            os.remove(shard_path)
+        self._write(self._map_path, impact_map)
+        logger.info(f"Impact map with {len(impact_map['tests'])} tests written to {self._map_path}")
+
+    @staticmethod
+    def _write(path, impact_map):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as map_file:
+            json.dump(impact_map, map_file, indent=1, sort_keys=True)
+        os.replace(temporary_path, path)
+
+    def _report(self, message):
+        logger.info(message)
+        reporter = self._config.pluginmanager.get_plugin("terminalreporter")
+        if reporter is not None:
+            reporter.write_line(message)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact", "test impact analysis")
+    group.addoption("--impact-record", action="store_true", default=False,
+                    help="Record which page-object symbols each test exercises.")
+    group.addoption("--impact-select", action="store_true", default=False,
+                    help="Run only tests affected by page-object changes in the working tree.")
+    group.addoption("--impact-map", default=IMPACT_MAP_PATH,
+                    help="Path of the recorded impact map (default: %(default)s).")
+
+
+def pytest_configure(config):
+    record = config.getoption("impact_record")
+    select = config.getoption("impact_select")
+    if record or select:
+        plugin = ImpactAnalysisPlugin(config, record, select, config.getoption("impact_map"))
+        config.pluginmanager.register(plugin, "impact_analysis_plugin")
@@ -0,0 +1,360 @@
+# utils/load_runner.py
+"""
+Synthetic load mode driving page-object journeys from many concurrent headless browsers.
+
+Each virtual user owns one headless Chrome session on a thread of a pool and repeats the configured
+journeys (built from the same page objects as the functional tests) until the run ends.  Users start
+one after the other over the ramp-up period.  Every journey step is timed into a log-bucketed latency
+histogram, and the run is exported as a JSON summary with per-step percentiles and throughput::
+
+    python -m utils.load_runner --stand-in --users 8 --ramp-up 20 --duration 120 --output load-summary.json
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.common.by import By
+
+from pages.conditions import Condition
+from pages.home_page import MagentoHomePage
+from utils.config import (BROWSER_PATH, EXPLICIT_WAIT, LOAD_DURATION, LOAD_RAMP_UP, LOAD_THINK_TIME, LOAD_USERS,
+                          LOAD_WINDOW_SIZE, PAGE_LOAD_TIME, URL)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Bucket boundaries grow by 2 ** (1 / 4), i.e. about 19% per bucket
+_BUCKETS_PER_DOUBLING = 4
+_PERCENTILES = (50, 90, 95, 99)
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram in milliseconds; constant memory however many samples it holds.
+    """
+
+    def __init__(self):
+        self.buckets = defaultdict(int)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    @staticmethod
+    def bucket_of(ms):
+        return math.floor(math.log2(max(ms, 0.001)) * _BUCKETS_PER_DOUBLING)
+
+    @staticmethod
+    def upper_bound(bucket):
+        return 2 ** ((bucket + 1) / _BUCKETS_PER_DOUBLING)
+
+    def add(self, ms):
+        self.buckets[self.bucket_of(ms)] += 1
+        self.count += 1
+        self.total += ms
+        self.min = ms if self.min is None else min(self.min, ms)
+        self.max = ms if self.max is None else max(self.max, ms)
+
+    def percentile(self, pct):
+        """
+        Upper bound of the bucket holding the given percentile, capped at the largest sample.
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(pct * self.count / 100))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(self.upper_bound(bucket), self.max)
+        return self.max
+
+    def as_dict(self):
+        stats = {"count": self.count, "mean_ms": round(self.total / self.count, 1) if self.count else None,
+                 "min_ms": round(self.min, 1) if self.count else None,
+                 "max_ms": round(self.max, 1) if self.count else None}
+        for pct in _PERCENTILES:
+            value = self.percentile(pct)
+            stats[f"p{pct}_ms"] = round(value, 1) if value is not None else None
+        stats["buckets"] = {f"{self.upper_bound(bucket):.1f}": count for bucket, count in sorted(self.buckets.items())}
+        return stats
+
+
+class LoadStats:
+    """
+    Thread-safe step latencies, errors and completed journeys of a load run.
+    """
+
+    def __init__(self):
+        self.steps = defaultdict(LatencyHistogram)
+        self.step_errors = defaultdict(int)
+        self.journeys = defaultdict(int)
+        self.journey_errors = defaultdict(int)
+        self.timeline = defaultdict(int)
+        self.errors = []
+        self._lock = threading.Lock()
+
+    def add_step(self, name, ms):
+        with self._lock:
+            self.steps[name].add(ms)
+
+    def add_step_error(self, name, error):
+        with self._lock:
+            self.step_errors[name] += 1
+            if len(self.errors) < 20:
+                self.errors.append(f"{name}: {type(error).__name__}: {error}")
+
+    def add_journey(self, name, second, ok):
+        with self._lock:
+            if ok:
+                self.journeys[name] += 1
+                self.timeline[second] += 1
+            else:
+                self.journey_errors[name] += 1
+
+
+class VirtualUser:
+    """
+    One simulated shopper: a browser session plus the helpers journeys use to time their steps.
+    """
+
+    def __init__(self, index, driver, base_url, stats):
+        self.index = index
+        self.driver = driver
+        self.base_url = base_url
+        self._stats = stats
+
+    @contextmanager
+    def step(self, name):
+        """
+        Time a journey step; failures are counted against the step and end the journey.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self._stats.add_step_error(name, e)
+            raise
+        self._stats.add_step(name, (time.perf_counter() - start) * 1000)
+
+    def home(self):
+        with self.step("home"):
+            self.driver.get(self.base_url)
+        return MagentoHomePage(self.driver, PAGE_LOAD_TIME)
+
+
+def search_journey(user, query="shirt"):
+    home = user.home()
+    with user.step("search"):
+        results = home.search_for_product(query)
+        results.has_search_results()
+    with user.step("product_list"):
+        results.get_products()
+
+
+def currency_journey(user, currency="EUR"):
+    home = user.home()
+    with user.step("change_currency"):
+        home.change_currency(currency)
+        home.wait_for_any(Condition.text(MagentoHomePage._currency_dropdown, currency), timeout=EXPLICIT_WAIT)
+
+
+def cart_journey(user):
+    home = user.home()
+    with user.step("open_cart"):
+        home.open_cart()
+        home.wait_for_any(Condition.visible((By.CSS_SELECTOR, ".block-minicart")), timeout=EXPLICIT_WAIT)
+
+
+JOURNEYS = {
+    "search": search_journey,
+    "currency": currency_journey,
+    "cart": cart_journey,
+}
+
+
+def start_headless_chrome():
+    """
+    Start a headless Chrome session for a virtual user.
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument(f"--window-size={LOAD_WINDOW_SIZE}")
+    options.add_argument("--disable-dev-shm-usage")
+    # Use the project's chromedriver if present, otherwise let Selenium Manager resolve one
+    service = Service(executable_path=BROWSER_PATH) if os.path.exists(BROWSER_PATH) else Service()
+    return webdriver.Chrome(service=service, options=options)
+
+
+class LoadRunner:
+    """
+    Runs journeys from a pool of concurrent browser sessions with a linear ramp-up.
+
+    Args:
+        url (str): Base URL of the storefront.
+        journeys (list): (name, function) pairs; each function takes a VirtualUser.
+        users (int): Number of concurrent virtual users (default LOAD_USERS).
+        ramp_up (float): Seconds over which the users are started (default LOAD_RAMP_UP).
+        duration (float): Seconds after which no new journeys start (default LOAD_DURATION).
+        iterations (int): Optional number of journeys per user, ending the run earlier.
+        think_time (float): Pause between two journeys of a user in seconds (default LOAD_THINK_TIME).
+        driver_factory (callable): Creates the browser session of a user (default headless Chrome).
+    """
+
+    def __init__(self, url, journeys, users=LOAD_USERS, ramp_up=LOAD_RAMP_UP, duration=LOAD_DURATION,
+                 iterations=None, think_time=LOAD_THINK_TIME, driver_factory=start_headless_chrome):
+        if not journeys:
+            raise ValueError("At least one journey is required")
+        self.url = url
+        self.journeys = list(journeys)
+        self.users = users
+        self.ramp_up = ramp_up
+        self.duration = duration
+        self.iterations = iterations
+        self.think_time = think_time
+        self.driver_factory = driver_factory
+        self.stats = LoadStats()
+        self._stop = threading.Event()
+        self._start = None
+        self._elapsed = None
+
+    def run(self):
+        """
+        Run the load and return its summary.
+        """
+        self._start = time.monotonic()
+        logger.info(f"Starting load: {self.users} users over {self.ramp_up}s against {self.url}")
+        try:
+            with ThreadPoolExecutor(max_workers=self.users, thread_name_prefix="load-user") as pool:
+                for future in [pool.submit(self._run_user, index) for index in range(self.users)]:
+                    future.result()
+        except KeyboardInterrupt:
+            self._stop.set()
+            raise
+        finally:
+            self._elapsed = time.monotonic() - self._start
+        return self.summary()
+
+    def stop(self):
+        self._stop.set()
+
+    def _finished(self, iteration):
+        if self.iterations is not None and iteration >= self.iterations:
+            return True
+        return self._stop.is_set() or time.monotonic() - self._start >= self.duration
+
+    def _run_user(self, index):
+        if self._stop.wait(self.ramp_up * index / self.users):
+            return
+        start = time.perf_counter()
+        try:
+            driver = self.driver_factory()
+        except Exception as e:
+            self.stats.add_step_error("start_browser", e)
+            logger.error(f"Virtual user {index} could not start a browser: {e}")
+            return
+        self.stats.add_step("start_browser", (time.perf_counter() - start) * 1000)
+        user = VirtualUser(index, driver, self.url, self.stats)
+        iteration = 0
+        try:
+            while not self._finished(iteration):
+                name, journey = self.journeys[(index + iteration) % len(self.journeys)]
+                try:
+                    journey(user)
+                    ok = True
+                except Exception as e:
+                    logger.error(f"Virtual user {index} failed journey {name}: {e}")
+                    ok = False
+                self.stats.add_journey(name, int(time.monotonic() - self._start), ok)
+                iteration += 1
+                if self.think_time and self._stop.wait(self.think_time):
+                    break
+        finally:
+            driver.quit()
+
+    def summary(self):
+        """
+        JSON-serialisable summary: step latency histograms, journey counts and throughput.
+        """
+        elapsed = self._elapsed or (time.monotonic() - self._start if self._start else 0.0)
+        stats = self.stats
+        completed = sum(stats.journeys.values())
+        steps = sum(histogram.count for histogram in stats.steps.values())
+        return {
+            "url": self.url,
+            "users": self.users,
+            "ramp_up_s": self.ramp_up,
+            "elapsed_s": round(elapsed, 2),
+            "journeys": {name: {"completed": stats.journeys[name], "failed": stats.journey_errors[name]}
+                         for name, _ in self.journeys},
+            "throughput": {
+                "journeys_per_s": round(completed / elapsed, 3) if elapsed else None,
+                "steps_per_s": round(steps / elapsed, 3) if elapsed else None,
+                "journeys_per_second_timeline": [stats.timeline[second] for second in range(int(elapsed) + 1)],
+            },
+            "steps": {name: {**stats.steps[name].as_dict(), "errors": stats.step_errors[name]}
+                      for name in sorted(set(stats.steps) | set(stats.step_errors))},
+            "errors": list(stats.errors),
+        }
+
+
+def format_summary(summary):
+    lines = [f"{summary['users']} users, {summary['elapsed_s']}s: "
+             f"{summary['throughput']['journeys_per_s']} journeys/s, {summary['throughput']['steps_per_s']} steps/s"]
+    for name, journey in summary["journeys"].items():
+        lines.append(f"journey {name}: {journey['completed']} completed, {journey['failed']} failed")
+    for name, step in summary["steps"].items():
+        lines.append(f"step {name}: n={step['count']} errors={step['errors']} mean={step['mean_ms']}ms "
+                     f"p50={step['p50_ms']}ms p95={step['p95_ms']}ms p99={step['p99_ms']}ms max={step['max_ms']}ms")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.load_runner")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", default=URL, help="Storefront base URL (default: the configured URL).")
+    target.add_argument("--stand-in", action="store_true", help="Start the local stand-in storefront and use it.")
+    parser.add_argument("--journey", action="append", choices=sorted(JOURNEYS),
+                        help="Journey to run; repeat for several (default: all).")
+    parser.add_argument("--users", type=int, default=LOAD_USERS, help="Concurrent virtual users.")
+    parser.add_argument("--ramp-up", type=float, default=LOAD_RAMP_UP, help="Seconds over which users start.")
+    parser.add_argument("--duration", type=float, default=LOAD_DURATION, help="Seconds to keep starting journeys.")
+    parser.add_argument("--iterations", type=int, default=None, help="Journeys per user (ends the run earlier).")
+    parser.add_argument("--think-time", type=float, default=LOAD_THINK_TIME, help="Seconds between journeys.")
+    parser.add_argument("--output", help="Write the JSON summary to this file.")
+    args = parser.parse_args(argv)
+
+    journeys = [(name, JOURNEYS[name]) for name in (args.journey or JOURNEYS)]
+    server = None
+    url = args.url
+    if args.stand_in:
+        from utils.stand_in_server import StandInServer
+        server = StandInServer().start()
+        url = server.url
+    try:
+        runner = LoadRunner(url, journeys, users=args.users, ramp_up=args.ramp_up, duration=args.duration,
+                            iterations=args.iterations, think_time=args.think_time)
+        summary = runner.run()
+    finally:
+        if server is not None:
+            server.stop()
+
+    for line in format_summary(summary):
+        print(line)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output_file:
+            json.dump(summary, output_file, indent=2)
+    return 1 if any(journey["failed"] for journey in summary["journeys"].values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,25 +2,35 @@
 import logging
 from datetime import datetime
 
+# One log file per process: the timestamp is taken once, and the file is only created when the first record is written
+_file_handler = None
 
-def get_logger(name):
-    # Get current date and time
-    current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-    log_file_name = f"test_{current_time}.log"  # Append current time to file name
 
+def _get_file_handler():
+    global _file_handler
+    if _file_handler is None:
+        # Get current date and time
+        current_time = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        log_file_name = f"test_{current_time}.log"  # Append current time to file name
+
+        # Create a file handler and set the level to DEBUG
+        _file_handler = logging.FileHandler(log_file_name, delay=True)
+        _file_handler.setLevel(logging.DEBUG)
+
+        # Create a formatter and set the format for the logs
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        _file_handler.setFormatter(formatter)
+    return _file_handler
+
+
+def get_logger(name):
     # Create a logger
     logger = logging.getLogger(name)
     logger.setLevel(logging.DEBUG)
 
-    # Create a file handler and set the level to DEBUG
-    file_handler = logging.FileHandler(log_file_name)
-    file_handler.setLevel(logging.DEBUG)
-
-    # Create a formatter and set the format for the logs
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    file_handler.setFormatter(formatter)
-
-    # Add the file handler to the logger
-    logger.addHandler(file_handler)
+    # Add the shared file handler to the logger, once
+    file_handler = _get_file_handler()
+    if file_handler not in logger.handlers:
+        logger.addHandler(file_handler)
 
     return logger
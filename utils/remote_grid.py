@@ -0,0 +1,290 @@
+# utils/remote_grid.py
+"""
+Remote (Selenium Grid compatible) execution backend.
+
+Sessions are sharded across the hosts listed in ``GRID_HOSTS``.  Any W3C WebDriver endpoint
+works as a host: a Grid hub or node, a standalone Selenium server, or a plain
+``chromedriver --port=9515`` process.  Every session talks to its host over a pooled
+keep-alive urllib3 connection, and per-host health and command latency are tracked.
+"""
+import json
+import threading
+import time
+
+import pytest
+import urllib3
+from selenium import webdriver
+from selenium.common import WebDriverException
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+from utils.config import (GRID_BROWSER, GRID_CONNECT_TIMEOUT, GRID_HEALTH_TIMEOUT, GRID_HEALTH_TTL, GRID_HOSTS,
+                          GRID_POOL_MAXSIZE, GRID_READ_TIMEOUT)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_host_pool = None
+# Host stats reported by the xdist workers, which own the sessions
+_worker_stats = []
+
+
+class HostStats:
+    """
+    Health, session and command latency statistics for one remote host.
+    """
+
+    def __init__(self, url):
+        self.url = url.rstrip("/")
+        self.healthy = None
+        self.last_check = 0.0
+        self.health_latency = None
+        self.active_sessions = 0
+        self.total_sessions = 0
+        self.failures = 0
+        self.commands = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self._lock = threading.Lock()
+
+    def record_command(self, seconds):
+        with self._lock:
+            self.commands += 1
+            self.latency_total += seconds
+            self.latency_max = max(self.latency_max, seconds)
+
+    @property
+    def mean_latency(self):
+        return self.latency_total / self.commands if self.commands else 0.0
+
+    def as_dict(self):
+        return {
+            "url": self.url,
+            "healthy": self.healthy,
+            "health_latency_ms": round(self.health_latency * 1000, 1) if self.health_latency is not None else None,
+            "active_sessions": self.active_sessions,
+            "total_sessions": self.total_sessions,
+            "failures": self.failures,
+            "commands": self.commands,
+            "mean_latency_ms": round(self.mean_latency * 1000, 1),
+            "max_latency_ms": round(self.latency_max * 1000, 1),
+        }
+
+
+class PooledRemoteConnection(RemoteConnection):
+    """
+    Keep-alive command connection with a tuned urllib3 pool that records per-command latency.
+    """
+
+    def __init__(self, host, pool_maxsize=GRID_POOL_MAXSIZE, connect_timeout=GRID_CONNECT_TIMEOUT,
+                 read_timeout=GRID_READ_TIMEOUT):
+        self._host = host
+        self._pool_kw = {
+            "maxsize": pool_maxsize,
+            "block": False,
+            "timeout": urllib3.Timeout(connect=connect_timeout, read=read_timeout),
+            # Commands are not idempotent, so only connection failures are retried.
+            "retries": urllib3.Retry(total=None, connect=2, read=0, redirect=0, status=0),
+        }
+        super().__init__(host.url, keep_alive=True, ignore_proxy=True)
+
+    def _get_connection_manager(self):
+        manager = super()._get_connection_manager()
+        manager.connection_pool_kw.update(self._pool_kw)
+        return manager
+
+    def _request(self, method, url, body=None):
+        start = time.perf_counter()
+        try:
+            return super()._request(method, url, body=body)
+        finally:
+            self._host.record_command(time.perf_counter() - start)
+
+
+class HostPool:
+    """
+    Shards remote sessions across a list of hosts, skipping hosts that fail their health check.
+    """
+
+    def __init__(self, urls=GRID_HOSTS, health_timeout=GRID_HEALTH_TIMEOUT, health_ttl=GRID_HEALTH_TTL):
+        if not urls:
+            raise ValueError("No remote hosts configured. Set GRID_HOSTS in utils/config.py or the environment.")
+        self.hosts = [HostStats(url) for url in urls]
+        self._health_ttl = health_ttl
+        self._http = urllib3.PoolManager(timeout=urllib3.Timeout(total=health_timeout), retries=False)
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def check_health(self, host, force=False):
+        """
+        Query the host's /status endpoint, caching the result for the health TTL.
+
+        Returns:
+            bool: True if the host reports that it is ready for new sessions.
+        """
+        if not force and host.healthy is not None and time.monotonic() - host.last_check < self._health_ttl:
+            return host.healthy
+        start = time.perf_counter()
+        try:
+            response = self._http.request("GET", f"{host.url}/status")
+            host.healthy = response.status == 200 and bool(json.loads(response.data)["value"].get("ready", True))
+            host.health_latency = time.perf_counter() - start
+        except (urllib3.exceptions.HTTPError, ValueError, KeyError, AttributeError) as e:
+            logger.error(f"Health check failed for {host.url}: {e}")
+            host.healthy = False
+        host.last_check = time.monotonic()
+        return host.healthy
+
+    def candidates(self, shard_key=None):
+        """
+        Order the hosts for a new session.
+
+        With a shard key (e.g. the xdist worker index) the hosts are rotated so that each shard
+        prefers its own host; otherwise the least loaded, fastest hosts come first.
+        """
+        if shard_key is not None:
+            start = shard_key % len(self.hosts)
+            return self.hosts[start:] + self.hosts[:start]
+        return sorted(self.hosts, key=lambda host: (host.active_sessions, host.mean_latency))
+
+    def start_session(self, options, shard_key=None):
+        """
+        Start a remote session on the first healthy candidate host.
+
+        Args:
+            options: Selenium browser options for the session.
+            shard_key (int): Optional shard index used to pick the preferred host.
+
+        Returns:
+            WebDriver: Remote WebDriver instance.
+
+        Raises:
+            WebDriverException: If no host could start a session.
+        """
+        errors = []
+        for host in self.candidates(shard_key):
+            if not self.check_health(host):
+                errors.append(f"{host.url}: unhealthy")
+                continue
+            try:
+                driver = webdriver.Remote(command_executor=PooledRemoteConnection(host), options=options)
+            except (WebDriverException, urllib3.exceptions.HTTPError) as e:
+                logger.error(f"Failed to start session on {host.url}: {e}")
+                host.failures += 1
+                host.healthy = False
+                errors.append(f"{host.url}: {e}")
+                continue
+            with self._lock:
+                host.active_sessions += 1
+                host.total_sessions += 1
+                self._sessions[driver.session_id] = host
+            logger.info(f"Started remote session {driver.session_id} on {host.url}")
+            return driver
+        raise WebDriverException(f"No remote host could start a session: {'; '.join(errors)}")
+
+    def release(self, driver):
+        """
+        Forget a session after its driver has quit.
+        """
+        with self._lock:
+            host = self._sessions.pop(driver.session_id, None)
+            if host is not None:
+                host.active_sessions -= 1
+
+    def stats(self):
+        return [host.as_dict() for host in self.hosts]
+
+
+def get_host_pool():
+    """
+    Return the process-wide host pool, creating it on first use.
+    """
+    global _host_pool
+    if _host_pool is None:
+        _host_pool = HostPool()
+    return _host_pool
+
+
+def browser_options(browser=GRID_BROWSER):
+    """
+    Build the options object for the configured remote browser.
+    """
+    browser = browser.lower()
+    if browser == "chrome":
+        return webdriver.ChromeOptions()
+    if browser in ("firefox", "ff"):
+        return webdriver.FirefoxOptions()
+    if browser == "edge":
+        return webdriver.EdgeOptions()
+    raise ValueError(f"Unsupported remote browser: {browser}. Supported options: 'chrome', 'firefox', 'edge'.")
+
+
+def start_remote_driver(shard_key=None, browser=GRID_BROWSER):
+    """
+    Start a remote session for the configured browser on the host pool.
+
+    Args:
+        shard_key (int): Optional shard index (e.g. the xdist worker number).
+        browser (str): Browser name (default GRID_BROWSER).
+
+    Returns:
+        WebDriver: Remote WebDriver instance.
+    """
+    return get_host_pool().start_session(browser_options(browser), shard_key=shard_key)
+
+
+def merge_stats(reports):
+    """
+    Combine per-host stats reported by several processes into one entry per host.
+
+    Args:
+        reports (iterable): Lists of HostStats.as_dict() entries, one list per process.
+
+    Returns:
+        list: Combined entries in first-seen host order.
+    """
+    merged = {}
+    for report in reports:
+        for stats in report:
+            entry = merged.get(stats["url"])
+            if entry is None:
+                merged[stats["url"]] = dict(stats)
+                continue
+            weighted = entry["mean_latency_ms"] * entry["commands"] + stats["mean_latency_ms"] * stats["commands"]
+            for key in ("active_sessions", "total_sessions", "failures", "commands"):
+                entry[key] += stats[key]
+            entry["mean_latency_ms"] = round(weighted / entry["commands"], 1) if entry["commands"] else 0.0
+            entry["max_latency_ms"] = max(entry["max_latency_ms"], stats["max_latency_ms"])
+            latencies = [value for value in (entry["health_latency_ms"], stats["health_latency_ms"])
+                         if value is not None]
+            entry["health_latency_ms"] = max(latencies) if latencies else None
+            # A host counts as healthy only if no process found it unhealthy
+            if stats["healthy"] is not None:
+                entry["healthy"] = stats["healthy"] and entry["healthy"] is not False
+    return list(merged.values())
+
+
+def pytest_sessionfinish(session):
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None and _host_pool is not None:
+        workeroutput["remote_hosts"] = _host_pool.stats()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    stats = getattr(node, "workeroutput", {}).get("remote_hosts")
+    if stats:
+        _worker_stats.append(stats)
+
+
+def pytest_terminal_summary(terminalreporter):
+    reports = list(_worker_stats)
+    if _host_pool is not None:
+        reports.append(_host_pool.stats())
+    if not reports:
+        return
+    terminalreporter.section("remote hosts")
+    for stats in merge_stats(reports):
+        terminalreporter.write_line(
+            f"{stats['url']}: healthy={stats['healthy']} sessions={stats['total_sessions']} "
+            f"failures={stats['failures']} commands={stats['commands']} "
+            f"mean={stats['mean_latency_ms']}ms max={stats['max_latency_ms']}ms")
@@ -0,0 +1,320 @@
+# utils/result_stream.py
+"""
+Low-overhead streaming result writer.
+
+With ``--result-stream DIR`` every test result is appended as one JSON Lines record to a
+per-worker shard (``DIR/results-<worker>.jsonl``) as soon as the test's teardown finishes.
+Attachments are stored once per content hash under ``DIR/attachments``.  Nothing is kept
+in memory beyond the test that is currently running.  Shards of an earlier run in the same
+directory are removed before the workers start.
+
+Shards are combined afterwards with::
+
+    python -m utils.result_stream merge DIR --summary summary.json --allure allure-results
+"""
+import argparse
+import glob
+import hashlib
+import heapq
+import json
+import mimetypes
+import os
+import shutil
+import sys
+import uuid
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+ATTACHMENTS_DIRECTORY = "attachments"
+ALLURE_STATUS = {"passed": "passed", "failed": "failed", "error": "broken", "skipped": "skipped"}
+
+_active_writer = None
+
+
+def attach(data, name, mime_type="text/plain"):
+    """
+    Attach content to the currently running test's streamed result.
+
+    Does nothing when result streaming is not enabled.
+
+    Args:
+        data (bytes or str): The attachment content.
+        name (str): Display name of the attachment.
+        mime_type (str): MIME type of the content (default "text/plain").
+    """
+    if _active_writer is not None:
+        _active_writer.attach(data, name, mime_type)
+
+
+def store_attachment(directory, data, mime_type):
+    """
+    Store attachment content under its SHA-256 hash, writing it only once.
+
+    Returns:
+        str: File name of the stored attachment relative to the attachments directory.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    extension = mimetypes.guess_extension(mime_type) or ".bin"
+    file_name = f"{hashlib.sha256(data).hexdigest()}{extension}"
+    destination = os.path.join(directory, file_name)
+    if not os.path.exists(destination):
+        temporary_path = f"{destination}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as attachment_file:
+            attachment_file.write(data)
+        os.replace(temporary_path, destination)
+    return file_name
+
+
+class ResultStreamWriter:
+    """
+    Pytest plugin appending one record per finished test to a JSON Lines shard.
+    """
+
+    def __init__(self, directory, worker_id):
+        self._directory = directory
+        self._worker_id = worker_id
+        self._attachments_directory = os.path.join(directory, ATTACHMENTS_DIRECTORY)
+        os.makedirs(self._attachments_directory, exist_ok=True)
+        self._shard = open(os.path.join(directory, f"results-{worker_id}.jsonl"), "w", encoding="utf-8")
+        self._pending = {}
+        self._current = None
+
+    def attach(self, data, name, mime_type):
+        if self._current is None:
+            logger.error(f"Attachment '{name}' ignored: no test is running")
+            return
+        source = store_attachment(self._attachments_directory, data, mime_type)
+        self._pending[self._current]["attachments"].append({"name": name, "source": source, "type": mime_type})
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self._current = nodeid
+        self._pending[nodeid] = {
+            "nodeid": nodeid,
+            "file": location[0],
+            "name": location[2],
+            "worker": self._worker_id,
+            "outcome": "passed",
+            "start": None,
+            "stop": None,
+            "duration": 0.0,
+            "message": None,
+            "trace": None,
+            "attachments": [],
+            "properties": [],
+        }
+
+    def pytest_runtest_logreport(self, report):
+        record = self._pending.get(report.nodeid)
+        if record is None:
+            return
+        if record["start"] is None:
+            record["start"] = report.start
+        record["stop"] = report.stop
+        record["duration"] += report.duration
+
+        if report.failed and record["outcome"] in ("passed", "skipped"):
+            record["outcome"] = "failed" if report.when == "call" else "error"
+            reprcrash = getattr(report.longrepr, "reprcrash", None)
+            record["message"] = reprcrash.message if reprcrash is not None else str(report.longrepr)
+            record["trace"] = report.longreprtext
+        elif report.skipped and record["outcome"] == "passed":
+            record["outcome"] = "skipped"
+            if isinstance(report.longrepr, tuple):
+                record["message"] = report.longrepr[2]
+
+        if report.when == "teardown":
+            record["properties"] = [list(item) for item in report.user_properties]
+            self._write(self._pending.pop(report.nodeid))
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        self._current = None
+
+    def _write(self, record):
+        self._shard.write(json.dumps(record, default=str))
+        self._shard.write("\n")
+        self._shard.flush()
+
+    def close(self):
+        for record in self._pending.values():
+            self._write(record)
+        self._pending.clear()
+        self._shard.close()
+
+
+def iter_records(directory):
+    """
+    Stream records from every shard in a result directory, one at a time.
+
+    Yields:
+        dict: A single test result record.
+    """
+    for shard_path in sorted(glob.glob(os.path.join(directory, "results-*.jsonl"))):
+        with open(shard_path, encoding="utf-8") as shard:
+            for line in shard:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def summarize(records, slowest=10):
+    """
+    Aggregate records into a summary without holding them in memory.
+
+    Args:
+        records (iterable): Result records, e.g. from iter_records.
+        slowest (int): Number of slowest tests to keep (default 10).
+
+    Returns:
+        dict: Totals per outcome, total duration and the slowest tests.
+    """
+    outcomes = {"passed": 0, "failed": 0, "error": 0, "skipped": 0}
+    duration = 0.0
+    start = stop = None
+    heap = []
+    for count, record in enumerate(records):
+        outcomes[record["outcome"]] = outcomes.get(record["outcome"], 0) + 1
+        duration += record["duration"]
+        if record["start"] is not None:
+            start = record["start"] if start is None else min(start, record["start"])
+            stop = record["stop"] if stop is None else max(stop, record["stop"])
+        entry = (record["duration"], count, record["nodeid"])
+        if len(heap) < slowest:
+            heapq.heappush(heap, entry)
+        else:
+            heapq.heappushpop(heap, entry)
+    return {
+        "total": sum(outcomes.values()),
+        "outcomes": outcomes,
+        "duration": round(duration, 3),
+        "wall_time": round(stop - start, 3) if start is not None else 0.0,
+        "slowest": [{"nodeid": nodeid, "duration": round(d, 3)} for d, _, nodeid in sorted(heap, reverse=True)],
+    }
+
+
+def write_allure_result(record, source_directory, allure_directory, copied):
+    """
+    Write one record as an Allure result file and copy its attachments once.
+
+    Args:
+        record (dict): Result record.
+        source_directory (str): Result stream directory holding the attachments.
+        allure_directory (str): Allure results directory.
+        copied (set): Attachment file names already copied.
+    """
+    attachments = []
+    for attachment in record["attachments"]:
+        digest, extension = os.path.splitext(attachment["source"])
+        source = f"{digest}-attachment{extension}"
+        if source not in copied:
+            shutil.copyfile(os.path.join(source_directory, ATTACHMENTS_DIRECTORY, attachment["source"]),
+                            os.path.join(allure_directory, source))
+            copied.add(source)
+        attachments.append({"name": attachment["name"], "source": source, "type": attachment["type"]})
+
+    module_path = record["file"].replace("/", ".").rsplit(".py", 1)[0]
+    result = {
+        "uuid": uuid.uuid4().hex,
+        "historyId": hashlib.md5(record["nodeid"].encode("utf-8")).hexdigest(),
+        "name": record["name"],
+        "fullName": record["nodeid"],
+        "status": ALLURE_STATUS.get(record["outcome"], "unknown"),
+        "statusDetails": {"message": record["message"], "trace": record["trace"]},
+        "start": int((record["start"] or 0) * 1000),
+        "stop": int((record["stop"] or 0) * 1000),
+        "attachments": attachments,
+        "parameters": [{"name": name, "value": str(value)} for name, value in record["properties"]],
+        "labels": [{"name": "suite", "value": module_path}, {"name": "thread", "value": record["worker"]},
+                   {"name": "framework", "value": "pytest"}],
+    }
+    with open(os.path.join(allure_directory, f"{result['uuid']}-result.json"), "w", encoding="utf-8") as result_file:
+        json.dump(result, result_file)
+
+
+def merge(directory, summary_path=None, allure_directory=None):
+    """
+    Stream all shards of a result directory into a summary and/or Allure results.
+
+    Returns:
+        dict: The summary of all records.
+    """
+    copied = set()
+    if allure_directory:
+        os.makedirs(allure_directory, exist_ok=True)
+
+    def records():
+        for record in iter_records(directory):
+            if allure_directory:
+                write_allure_result(record, directory, allure_directory, copied)
+            yield record
+
+    summary = summarize(records())
+    if summary_path:
+        with open(summary_path, "w", encoding="utf-8") as summary_file:
+            json.dump(summary, summary_file, indent=2)
+    return summary
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("result-stream", "streaming result writer")
+    group.addoption("--result-stream", metavar="DIR", default=None,
+                    help="Write each test result to a JSON Lines shard per worker in DIR, replacing earlier runs.")
+
+
+def clear_shards(directory):
+    """
+    Remove the result shards of an earlier run, so that merging only sees this run's workers.
+    """
+    for shard_path in glob.glob(os.path.join(glob.escape(directory), "results-*.jsonl")):
+        os.remove(shard_path)
+
+
+def _is_xdist_controller(config):
+    # xdist registers its DSession in a trylast pytest_configure, after this one, so go by the options it acts on
+    return not hasattr(config, "workerinput") and getattr(config.option, "dist", "no") != "no"
+
+
+def pytest_configure(config):
+    global _active_writer
+    directory = config.getoption("result_stream")
+    if not directory:
+        return
+    workerinput = getattr(config, "workerinput", None)
+    # The controller (or the single process) runs before any worker starts, so it clears the previous run
+    if workerinput is None:
+        clear_shards(directory)
+    # The xdist controller only relays worker reports; the workers write the shards.
+    if _is_xdist_controller(config):
+        return
+    worker_id = workerinput["workerid"] if workerinput else "main"
+    _active_writer = ResultStreamWriter(directory, worker_id)
+    config.pluginmanager.register(_active_writer, "result_stream_writer")
+
+
+def pytest_unconfigure(config):
+    global _active_writer
+    if _active_writer is not None:
+        _active_writer.close()
+        config.pluginmanager.unregister(_active_writer)
+        _active_writer = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.result_stream")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    merge_parser = subparsers.add_parser("merge", help="Merge per-worker shards into a summary or Allure results.")
+    merge_parser.add_argument("directory", help="Directory passed to --result-stream.")
+    merge_parser.add_argument("--summary", help="Write the JSON summary to this file.")
+    merge_parser.add_argument("--allure", help="Write Allure-compatible results to this directory.")
+    args = parser.parse_args(argv)
+
+    summary = merge(args.directory, args.summary, args.allure)
+    json.dump(summary, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 1 if summary["outcomes"]["failed"] or summary["outcomes"]["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
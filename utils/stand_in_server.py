@@ -0,0 +1,221 @@
+# utils/stand_in_server.py
+"""
+Local stand-in for the Magento storefront.
+
+Serves the small part of the demo shop the page objects use (home page header with search, currency
+and language switchers, paginated search results, an empty-result notice and the cart) from an
+in-process threaded HTTP server, with the same markup hooks as the real site.  Useful for developing
+page objects and load journeys without depending on the public demo shop::
+
+    python -m utils.stand_in_server --port 8000
+"""
+import argparse
+import html
+import sys
+import threading
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote_plus, urlsplit
+
+from utils.config import STAND_IN_PAGE_SIZE
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CURRENCIES = {"USD": ("$", 1.0), "EUR": ("€", 0.93), "GBP": ("£", 0.79)}
+STORES = ("default", "de", "fr")
+
+_STYLES = ("nav ul, .block-minicart { display: none; } nav ul.active, .block-minicart.active { display: block; } "
+           "li.product-item { display: inline-block; }")
+# Dropdowns and the mini cart open in place, like the real storefront's widgets
+_TOGGLE_SCRIPT = """
+document.querySelectorAll('[data-toggle] button, .minicart-wrapper > a').forEach(function (trigger) {
+    trigger.addEventListener('click', function (event) {
+        event.preventDefault();
+        trigger.nextElementSibling.classList.toggle('active');
+    });
+});
+"""
+
+
+def _catalog():
+    styles = ("Radiant", "Breathe-Easy", "Argus", "Proteus", "Jupiter", "Montana", "Olivia", "Ingrid", "Juno",
+              "Stellar")
+    kinds = (("Tee", 22.0), ("Shirt", 29.0), ("Jacket", 59.0), ("Hoodie", 45.0), ("Short", 32.0))
+    products = []
+    for style_index, style in enumerate(styles):
+        for kind_index, (kind, base_price) in enumerate(kinds):
+            product_id = str(1000 + style_index * len(kinds) + kind_index)
+            slug = f"{style}-{kind}".lower()
+            products.append({"id": product_id, "name": f"{style} {kind}", "url": f"/{slug}.html",
+                             "price": base_price + style_index})
+    return products
+
+
+CATALOG = _catalog()
+
+
+def search_catalog(query):
+    """
+    Products whose name contains every word of the query (case-insensitive).
+    """
+    words = query.lower().split()
+    return [product for product in CATALOG if words and all(word in product["name"].lower() for word in words)]
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """
+    Request handler rendering the stand-in storefront pages.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        cookies = SimpleCookie(self.headers.get("Cookie", ""))
+        self.currency = cookies["currency"].value if "currency" in cookies else "USD"
+        if url.path == "/":
+            self._send_page("Home Page", "<h1>Home Page</h1>")
+        elif url.path == "/catalogsearch/result/":
+            self._search(params.get("q", ""), int(params.get("p", "1") or 1))
+        elif url.path == "/checkout/cart/":
+            self._send_page("Shopping Cart", "<h1>Shopping Cart</h1><p class='cart-empty'>You have no items.</p>")
+        elif url.path == "/directory/currency/switch/":
+            self._redirect(params.get("back", "/"), ("currency", params.get("currency", "USD")))
+        elif url.path == "/stores/store/switch/":
+            self._redirect(params.get("back", "/"), ("store", params.get("store", "default")))
+        else:
+            self._send(404, "text/html; charset=UTF-8", "<html><body><h1>404 Not Found</h1></body></html>")
+
+    def _search(self, query, page):
+        products = search_catalog(query)
+        title = f"Search results for: '{html.escape(query)}'"
+        if not products:
+            body = "<div class='message notice'><div>Your search returned no results.</div></div>"
+            self._send_page(title, body)
+            return
+        start = (page - 1) * STAND_IN_PAGE_SIZE
+        items = "".join(self._product_card(product) for product in products[start:start + STAND_IN_PAGE_SIZE])
+        pager = ""
+        if start + STAND_IN_PAGE_SIZE < len(products):
+            pager = (f"<div class='pages'><ul><li class='item pages-item-next'>"
+                     f"<a href='/catalogsearch/result/?q={quote_plus(query)}&amp;p={page + 1}'>Next</a>"
+                     f"</li></ul></div>")
+        self._send_page(title, f"<div class='search results'><ol class='products list'>{items}</ol></div>{pager}")
+
+    def _product_card(self, product):
+        symbol, rate = CURRENCIES.get(self.currency, CURRENCIES["USD"])
+        amount = round(product["price"] * rate, 2)
+        return (f"<li class='item product product-item'>"
+                f"<a class='product-item-link' href='{product['url']}'>{html.escape(product['name'])}</a>"
+                f"<div class='price-box price-final_price' data-product-id='{product['id']}'>"
+                f"<span data-price-amount='{amount}' data-price-type='finalPrice' class='price-wrapper'>"
+                f"<span class='price'>{symbol}{amount:.2f}</span></span></div></li>")
+
+    def _header(self):
+        back = quote_plus(self.path)
+        currencies = "".join(f"<li><a data-currency-code='{code}' "
+                             f"href='/directory/currency/switch/?currency={code}&amp;back={back}'>{code}</a></li>"
+                             for code in CURRENCIES)
+        stores = "".join(f"<li><a data-store-code='{store}' "
+                         f"href='/stores/store/switch/?store={store}&amp;back={back}'>{store}</a></li>"
+                         for store in STORES)
+        return (f"<header><nav>"
+                f"<div data-block='store-language' data-toggle='1'><button type='button'>Language</button>"
+                f"<ul>{stores}</ul></div>"
+                f"<div data-block='store-currency' data-toggle='1'><button type='button'>{self.currency}</button>"
+                f"<ul>{currencies}</ul></div>"
+                f"</nav>"
+                f"<div class='minicart-wrapper'><a class='action showcart' href='/checkout/cart/'>Cart</a>"
+                f"<div class='block block-minicart'><strong class='subtitle empty'>"
+                f"You have no items in your shopping cart.</strong></div></div>"
+                f"<form id='search_mini_form' action='/catalogsearch/result/' method='get'>"
+                f"<input id='search' name='q' type='text'>"
+                f"<button type='submit' title='Search'>Search</button></form></header>")
+
+    def _send_page(self, title, content):
+        page = (f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{title}</title>"
+                f"<style>{_STYLES}</style></head><body>{self._header()}"
+                f"<main><div class='column main'>{content}</div></main>"
+                f"<script>{_TOGGLE_SCRIPT}</script></body></html>")
+        self._send(200, "text/html; charset=UTF-8", page)
+
+    def _redirect(self, location, cookie):
+        self.send_response(302)
+        self.send_header("Location", location if location.startswith("/") and not location.startswith("//") else "/")
+        self.send_header("Set-Cookie", f"{cookie[0]}={cookie[1]}; Path=/")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send(self, status, content_type, body):
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+
+class StandInServer:
+    """
+    Threaded stand-in storefront running in the background; usable as a context manager.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self._server = ThreadingHTTPServer((host, port), StandInHandler)
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stand-in-server", daemon=True)
+        self._thread.start()
+        logger.info(f"Stand-in storefront listening on {self.url}")
+        return self
+
+    def serve_forever(self):
+        """
+        Serve in the calling thread until interrupted.
+        """
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.stand_in_server")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=8000, help="Port to listen on.")
+    args = parser.parse_args(argv)
+
+    server = StandInServer(args.host, args.port)
+    print(f"Serving the stand-in storefront on {server.url}")
+    server.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
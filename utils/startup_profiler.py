@@ -0,0 +1,263 @@
+# utils/startup_profiler.py
+"""
+Collection and startup profiler.
+
+Load the plugin before the conftest so that every import is seen::
+
+    python -m pytest -p utils.startup_profiler --startup-profile -k test_search_product
+
+An import hook at the front of ``sys.meta_path`` times each module's execution (self and cumulative,
+so a package's own cost is separated from the modules it pulls in).  The terminal summary reports the
+slowest modules, the cost per top-level package and the phases up to the first test: initial conftests,
+collection, the first test's fixture setup and the first WebDriver session.  With pytest-xdist, each
+worker's phases are reported as well.
+"""
+import sys
+import threading
+import time
+from collections import defaultdict
+
+import pytest
+
+from utils.config import STARTUP_PROFILE_TOP
+
+_origin = time.perf_counter()
+
+
+class _TimedLoader:
+    """
+    Loader proxy timing ``exec_module``; the module gets its real loader back before it executes.
+    """
+
+    def __init__(self, timer, loader, name):
+        self._timer = timer
+        self._loader = loader
+        self._name = name
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        create_module = getattr(self._loader, "create_module", None)
+        return create_module(spec) if create_module is not None else None
+
+    def exec_module(self, module):
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._timer.measure(self._name):
+            self._loader.exec_module(module)
+
+
+class ImportTimer:
+    """
+    Meta path finder recording how long every newly imported module takes to execute.
+    """
+
+    def __init__(self):
+        self.modules = {}
+        self._local = threading.local()
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(self, spec.loader, name)
+                    return spec
+            return None
+        finally:
+            self._local.finding = False
+
+    def measure(self, name):
+        return _Measurement(self, name)
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def slowest(self, count=STARTUP_PROFILE_TOP):
+        """
+        The modules with the highest self time, as (name, self seconds, cumulative seconds).
+        """
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][0], reverse=True)
+        return [(name, own, cumulative) for name, (own, cumulative) in ranked[:count]]
+
+    def by_package(self, count=STARTUP_PROFILE_TOP):
+        """
+        Self time summed per top-level package, highest first.
+        """
+        totals = defaultdict(float)
+        for name, (own, _) in self.modules.items():
+            totals[name.partition(".")[0]] += own
+        return sorted(totals.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+class _Measurement:
+
+    def __init__(self, timer, name):
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self):
+        self._stack = self._timer._stack()
+        self._stack.append(0.0)
+        self._start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        cumulative = time.perf_counter() - self._start
+        children = self._stack.pop()
+        if self._stack:
+            self._stack[-1] += cumulative
+        self._timer.modules[self._name] = (cumulative - children, cumulative)
+
+
+class StartupProfiler:
+    """
+    Records the startup phases of a session and reports them with the import timings.
+    """
+
+    def __init__(self, timer):
+        self.timer = timer
+        self.phases = {}
+        self.marks = {}
+        self.tests = 0
+        self.workers = {}
+        self._first_setup = True
+
+    def phase(self, name, start, end):
+        self.phases[name] = end - start
+        self.marks[name] = end - _origin
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection(self, session):
+        start = time.perf_counter()
+        yield
+        # The xdist controller does not collect; its workers report their own collection
+        if not session.config.pluginmanager.hasplugin("dsession"):
+            self.phase("collection", start, time.perf_counter())
+
+    def pytest_collection_finish(self, session):
+        self.tests = len(session.items)
+        self._patch_start_session()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        if not self._first_setup:
+            yield
+            return
+        self._first_setup = False
+        start = time.perf_counter()
+        yield
+        self.phase("first fixture setup", start, time.perf_counter())
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        if "time to first test" not in self.marks:
+            self.marks["time to first test"] = time.perf_counter() - _origin
+        yield
+
+    def _patch_start_session(self):
+        # Only time the first session; nothing is patched if the suite never imported WebDriver
+        module = sys.modules.get("selenium.webdriver.remote.webdriver")
+        if module is None:
+            return
+        web_driver = module.WebDriver
+        original = web_driver.start_session
+        profiler = self
+
+        def start_session(driver, *args, **kwargs):
+            web_driver.start_session = original
+            start = time.perf_counter()
+            try:
+                return original(driver, *args, **kwargs)
+            finally:
+                profiler.phase("first driver", start, time.perf_counter())
+
+        web_driver.start_session = start_session
+
+    def as_dict(self):
+        return {"phases": dict(self.phases), "marks": dict(self.marks), "tests": self.tests}
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(session.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput["startup_profile"] = self.as_dict()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        profile = getattr(node, "workeroutput", {}).get("startup_profile")
+        if profile is not None:
+            self.workers[node.workerinput["workerid"]] = profile
+
+    def pytest_terminal_summary(self, terminalreporter):
+        write = terminalreporter.write_line
+        terminalreporter.section("startup profile")
+        for name, seconds in self.phases.items():
+            suffix = f" ({self.tests} tests)" if name == "collection" else ""
+            write(f"{name:<24}{seconds:8.3f}s  (done at {self.marks[name]:.3f}s){suffix}")
+        if "time to first test" in self.marks:
+            write(f"{'time to first test':<24}{self.marks['time to first test']:8.3f}s")
+        for worker, profile in sorted(self.workers.items()):
+            phases = ", ".join(f"{name} {seconds:.3f}s" for name, seconds in profile["phases"].items())
+            write(f"worker {worker}: {phases}")
+        if not self.timer.modules:
+            return
+        write("slowest imports (self / cumulative):")
+        for name, own, cumulative in self.timer.slowest():
+            write(f"  {own * 1000:8.1f} ms / {cumulative * 1000:8.1f} ms  {name}")
+        write("import time by package: " + ", ".join(f"{package} {own * 1000:.0f} ms"
+                                                     for package, own in self.timer.by_package()))
+
+
+_timer = ImportTimer()
+_phase_key = pytest.StashKey()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("startup-profile", "collection and startup profiler")
+    group.addoption("--startup-profile", action="store_true", default=False,
+                    help="Report import times and the startup phases up to the first test "
+                         "(load with -p utils.startup_profiler to include the conftest imports).")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_load_initial_conftests(early_config):
+    # Only runs when the plugin was loaded with -p, i.e. before the conftest is imported
+    if not early_config.known_args_namespace.startup_profile:
+        yield
+        return
+    _timer.install()
+    start = time.perf_counter()
+    yield
+    early_config.stash[_phase_key] = (start, time.perf_counter())
+
+
+def pytest_configure(config):
+    if not config.getoption("startup_profile"):
+        return
+    _timer.install()
+    profiler = StartupProfiler(_timer)
+    if _phase_key in config.stash:
+        profiler.phase("initial conftests", *config.stash[_phase_key])
+    config.pluginmanager.register(profiler, "startup_profiler_plugin")
+
+
+def pytest_unconfigure(config):
+    _timer.uninstall()
@@ -0,0 +1,461 @@
+# utils/tab_pool.py
+"""
+Multi-tab session multiplexing.
+
+With ``--tab-multiplex``, tests marked ``@pytest.mark.shared_tab`` (read-only and cookie independent)
+run in their own tab of a shared browser.  Under pytest-xdist with Chrome, the controller starts one
+Chrome per box and every worker attaches its own chromedriver to it (``goog:chromeOptions.debuggerAddress``),
+working in a window of its own; without xdist the shared browser is the session browser.  Each worker
+still runs its tests one at a time, and while a test runs, the tabs of its next eligible tests are
+already loading their start page in the background.  Every tab is closed when its test finishes, so the
+DOM state of one test never leaks into the next (cookies and storage are shared, which is why only tests
+that do not depend on them may opt in; all other tests keep the worker's own ``start_browser``).
+Memory of the browser process trees is sampled to compare the run with one browser per worker.
+"""
+from collections import OrderedDict
+from functools import partial
+
+import pytest
+from selenium import webdriver
+from selenium.common import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.wait import WebDriverWait
+
+from utils.config import BROWSER, BROWSER_PATH, PAGE_LOAD_TIME, TAB_LOOKAHEAD, URL
+from utils.logger import get_logger
+
+try:
+    import psutil
+except ImportError:  # Memory stats are optional
+    psutil = None
+
+logger = get_logger(__name__)
+
+_NAVIGATE_SCRIPT = "window.location.href = arguments[0];"
+_LOADED_SCRIPT = "return document.readyState === 'complete' && window.location.href !== 'about:blank';"
+
+# Every worker's window is in the background of the others'; keep their pages running at full speed
+_SHARED_CHROME_ARGUMENTS = ("--disable-backgrounding-occluded-windows", "--disable-renderer-backgrounding",
+                            "--disable-background-timer-throttling")
+_MB = 1024 * 1024
+
+
+def browser_rss(driver):
+    """
+    Resident memory in bytes of the local driver process and all browser processes it started.
+
+    Returns:
+        int or None: The total, or None when psutil is not installed or the browser is remote.
+    """
+    service = getattr(driver, "service", None)
+    process = getattr(service, "process", None)
+    if psutil is None or process is None:
+        return None
+    try:
+        root = psutil.Process(process.pid)
+        return sum(p.memory_info().rss for p in [root, *root.children(recursive=True)])
+    except psutil.Error:
+        return None
+
+
+def _mb(rss):
+    return None if rss is None else round(rss / _MB, 1)
+
+
+def shares_browser(config):
+    """
+    Whether the xdist workers of a run share one Chrome: with --tab-multiplex, a local Chrome, and neither
+    recording nor replaying WebDriver commands (recordings are kept per worker browser).
+    """
+    return (config.getoption("tab_multiplex") and BROWSER.lower() == "chrome"
+            and not config.getoption("record_commands") and not config.getoption("replay_commands"))
+
+
+def launch_shared_chrome():
+    """
+    Start the Chrome the workers attach to, showing the start page.
+    """
+    options = webdriver.ChromeOptions()
+    for argument in _SHARED_CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    driver = webdriver.Chrome(service=Service(executable_path=BROWSER_PATH), options=options)
+    driver.get(URL)
+    return driver
+
+
+def attach_shared_chrome(address):
+    """
+    Attach a new chromedriver session to the shared Chrome and open a window for this worker.
+
+    Returns:
+        WebDriver: The session, switched to the worker's window (its home window).
+    """
+    options = webdriver.ChromeOptions()
+    options.debugger_address = address
+    driver = webdriver.Chrome(service=Service(executable_path=BROWSER_PATH), options=options)
+    # The first window belongs to the controller; other workers' windows come and go
+    driver.switch_to.new_window("window")
+    return driver
+
+
+class SharedBrowser:
+    """
+    The Chrome the xdist controller starts for its workers, and the memory of its process tree.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.address = driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        # One browser showing the start page is what every worker runs on its own without sharing
+        self.single_rss = browser_rss(driver)
+        self.peak_rss = self.single_rss
+        driver.get("about:blank")
+
+    def sample(self):
+        rss = browser_rss(self.driver)
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss or 0, rss)
+
+    def quit(self):
+        self.sample()
+        self.driver.quit()
+
+
+def summarize(worker_stats, shared=None):
+    """
+    Lines of the tab multiplexing summary.
+
+    Args:
+        worker_stats (list): ``TabScheduler.stats()`` of every worker that ran shared-tab tests.
+        shared (SharedBrowser): The Chrome the workers attached to, or None if each worker used its own browser.
+
+    Returns:
+        list: Test and tab counts, then the memory of the run against one browser per worker.
+    """
+    workers = len(worker_stats)
+    lines = [f"{sum(stats['tests'] for stats in worker_stats)} tests in tabs on {workers} worker(s), "
+             f"{sum(stats['preloaded_hits'] for stats in worker_stats)} preloaded, "
+             f"up to {max(stats['max_tabs'] for stats in worker_stats)} tabs open per worker"]
+    peaks = [stats["peak_mb"] for stats in worker_stats]
+    if None in peaks or (shared is not None and not (shared.single_rss and shared.peak_rss)):
+        lines.append("memory: unavailable (install psutil and use a local browser)")
+    elif shared is not None:
+        # An attached worker's process tree is only its chromedriver; the browser is the controller's
+        drivers_mb = round(sum(peaks), 1)
+        peak_mb = round(_mb(shared.peak_rss) + drivers_mb, 1)
+        single_mb = _mb(shared.single_rss)
+        lines.append(f"memory: peak {peak_mb} MB for one Chrome shared by {workers} worker(s), "
+                     f"incl. {drivers_mb} MB of worker chromedrivers, vs {workers} x {single_mb} MB = "
+                     f"{round(workers * single_mb, 1)} MB with one browser per worker")
+    else:
+        baseline_mb = round(sum(stats["baseline_mb"] for stats in worker_stats), 1)
+        overhead_mb = round(sum(stats["preload_overhead_mb"] for stats in worker_stats), 1)
+        lines.append(f"memory: peak {round(sum(peaks), 1)} MB vs {baseline_mb} MB for {workers} browser(s) alone "
+                     f"(+{overhead_mb} MB for preloaded tabs)")
+    return lines
+
+
+class TabScheduler:
+    """
+    Hands out one window handle per test and preloads the tabs of upcoming tests.
+    """
+
+    def __init__(self, driver, lookahead=TAB_LOOKAHEAD, timeout=PAGE_LOAD_TIME, on_open=None):
+        self._driver = driver
+        self._lookahead = lookahead
+        self._timeout = timeout
+        self._on_open = on_open
+        self._home = driver.current_window_handle
+        self._prepared = OrderedDict()
+        self._open = set()
+        self.tests = 0
+        self.preloaded_hits = 0
+        self.max_tabs = 0
+        self.baseline_rss = browser_rss(driver)
+        self.peak_rss = self.baseline_rss
+
+    def _open_tab(self, url):
+        self._driver.switch_to.new_window("tab")
+        handle = self._driver.current_window_handle
+        if self._on_open is not None:
+            self._on_open(handle)
+        self._driver.execute_script(_NAVIGATE_SCRIPT, url)
+        # Counted per scheduler: a shared browser also lists the tabs of other workers
+        self._open.add(handle)
+        self.max_tabs = max(self.max_tabs, len(self._open))
+        return handle
+
+    def _sample_memory(self):
+        rss = browser_rss(self._driver)
+        if rss is not None:
+            self.peak_rss = max(self.peak_rss or 0, rss)
+
+    def prefetch(self, key, url):
+        """
+        Start loading a tab for an upcoming test without waiting for it.
+        """
+        if key in self._prepared or len(self._prepared) >= self._lookahead:
+            return
+        current = self._driver.current_window_handle
+        self._prepared[key] = self._open_tab(url)
+        self._driver.switch_to.window(current)
+        logger.info(f"Preloading {url} in a background tab for {key}")
+
+    def acquire(self, key, url):
+        """
+        Switch to the tab prepared for a test (opening one if needed) once its page has loaded.
+
+        Returns:
+            str: The window handle owned by the test.
+        """
+        handle = self._prepared.pop(key, None)
+        if handle is None:
+            handle = self._open_tab(url)
+        else:
+            self.preloaded_hits += 1
+            self._driver.switch_to.window(handle)
+        WebDriverWait(self._driver, timeout=self._timeout, poll_frequency=0.1).until(
+            lambda driver: driver.execute_script(_LOADED_SCRIPT))
+        self.tests += 1
+        self._sample_memory()
+        return handle
+
+    def release(self, handle):
+        """
+        Close a test's tab and return to the home tab.
+        """
+        if self._driver.current_window_handle != handle:
+            self._driver.switch_to.window(handle)
+        self._driver.close()
+        self._open.discard(handle)
+        self._driver.switch_to.window(self._home)
+
+    def discard_except(self, keys):
+        """
+        Close the preloaded tabs of tests that are no longer upcoming, e.g. because they were skipped.
+        """
+        keep = set(keys)
+        stale = [key for key in self._prepared if key not in keep]
+        if not stale:
+            return
+        current = self._driver.current_window_handle
+        for key in stale:
+            handle = self._prepared.pop(key)
+            self._driver.switch_to.window(handle)
+            self._driver.close()
+            self._open.discard(handle)
+            logger.info(f"Closed the preloaded tab of {key}, which did not run")
+        self._driver.switch_to.window(current if current in self._driver.window_handles else self._home)
+
+    def close_prepared(self):
+        """
+        Close every preloaded tab that was not handed to a test.
+        """
+        try:
+            self.discard_except(())
+        except WebDriverException as e:
+            logger.warning(f"Could not close the preloaded tabs: {e}")
+
+    def stats(self):
+        """
+        Counts and peak memory of the driver's process tree against its start; for a session attached to a shared
+        Chrome the tree is only the worker's chromedriver.
+        """
+        stats = {"tests": self.tests, "preloaded_hits": self.preloaded_hits, "max_tabs": self.max_tabs,
+                 "baseline_mb": None, "peak_mb": None, "preload_overhead_mb": None}
+        if self.baseline_rss and self.peak_rss:
+            stats["baseline_mb"] = _mb(self.baseline_rss)
+            stats["peak_mb"] = _mb(self.peak_rss)
+            stats["preload_overhead_mb"] = _mb(self.peak_rss - self.baseline_rss)
+        return stats
+
+
+class TabMultiplexPlugin:
+    """
+    Pytest plugin scheduling shared-tab tests and reporting their memory footprint.
+    """
+
+    def __init__(self, config):
+        self._config = config
+        self._distributed = hasattr(config, "workerinput")
+        self._attached = "tab_multiplex_browser" in getattr(config, "workerinput", {})
+        self._items = []
+        self._positions = {}
+        self._next_item = None
+        self._worker_stats = []
+        self._share = None
+        self.scheduler = None
+        self.shared = None
+
+    @staticmethod
+    def start_url(item):
+        marker = item.get_closest_marker("shared_tab")
+        if marker is None:
+            return None
+        return marker.kwargs.get("url", URL)
+
+    @classmethod
+    def _eligible(cls, item):
+        return cls.start_url(item) is not None and item.get_closest_marker("skip") is None
+
+    def pytest_collection_finish(self, session):
+        # Built from the final item list, after -k/-m and impact analysis deselected theirs
+        self._items = [item for item in session.items if self._eligible(item)]
+        self._positions = {item.nodeid: index for index, item in enumerate(self._items)}
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        # Runs before the last item's teardown quits the session browser
+        if nextitem is None and self.scheduler is not None:
+            self.scheduler.close_prepared()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self._next_item = nextitem
+        yield
+
+    def upcoming(self, item):
+        """
+        Eligible tests expected to run after the given one on this worker.
+        """
+        if self._distributed:
+            # Only the next item is known on an xdist worker
+            nextitem = self._next_item
+            return [nextitem] if nextitem is not None and self._eligible(nextitem) else []
+        position = self._positions.get(item.nodeid, -1)
+        return self._items[position + 1:position + 1 + TAB_LOOKAHEAD]
+
+    def scheduler_for(self, driver):
+        if self.scheduler is None:
+            on_open = None
+            if self._attached:
+                from utils import console_capture
+
+                # Console capture of a shared browser only follows the tabs this worker opens
+                on_open = partial(console_capture.watch_target, driver)
+            self.scheduler = TabScheduler(driver, on_open=on_open)
+        return self.scheduler
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node):
+        # Called on the xdist controller before each worker starts; the first call starts the shared Chrome
+        if self._share is None:
+            self._share = shares_browser(self._config)
+        if not self._share:
+            return
+        if self.shared is None:
+            try:
+                self.shared = SharedBrowser(launch_shared_chrome())
+            except WebDriverException as e:
+                logger.error(f"Could not start the shared browser, workers use their own: {e.msg}")
+                self._share = False
+                return
+            logger.info(f"Workers share the browser at {self.shared.address}")
+        node.workerinput["tab_multiplex_browser"] = self.shared.address
+
+    def pytest_runtest_logreport(self, report):
+        # Reports of all workers arrive here on the controller, a cheap point to sample the shared browser
+        if self.shared is not None:
+            self.shared.sample()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        stats = getattr(node, "workeroutput", {}).get("tab_multiplex")
+        if stats:
+            self._worker_stats.append(stats)
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(self._config, "workeroutput", None)
+        if workeroutput is not None and self.scheduler is not None:
+            workeroutput["tab_multiplex"] = self.scheduler.stats()
+        if self.shared is not None:
+            self.shared.quit()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        reports = list(self._worker_stats)
+        if self.scheduler is not None:
+            reports.append(self.scheduler.stats())
+        if not reports:
+            return
+        terminalreporter.section("tab multiplexing")
+        for line in summarize(reports, self.shared):
+            terminalreporter.write_line(line)
+
+
+@pytest.fixture(scope="session")
+def shared_browser(request):
+    """
+    Fixture giving shared-tab tests the browser they share.
+
+    On an xdist worker of a run that shares one Chrome, this attaches to it and works in a window of its own;
+    otherwise it is the worker's ``start_browser`` session.
+
+    Yields:
+        WebDriver: The driver hosting the worker's shared-tab tests.
+    """
+    address = getattr(request.config, "workerinput", {}).get("tab_multiplex_browser")
+    if address is None:
+        yield request.getfixturevalue("start_browser")
+        return
+
+    from utils import console_capture, web_metrics
+
+    logger.info(f"Attaching to the shared browser at {address}")
+    driver = attach_shared_chrome(address)
+    home = driver.current_window_handle
+    try:
+        console_capture.start_collector(driver, auto_attach=False)
+        console_capture.watch_target(driver, home)
+        driver.get(URL)
+        web_metrics.record_session_page(driver, "start_page")
+        yield driver
+    finally:
+        console_capture.stop_collector(driver)
+        try:
+            # Quitting an attached session leaves the browser running, so close this worker's window first
+            driver.switch_to.window(home)
+            driver.close()
+        except WebDriverException as e:
+            logger.warning(f"Could not close the worker's window of the shared browser: {e.msg}")
+        driver.quit()
+
+
+@pytest.fixture
+def tab_browser(request):
+    """
+    Fixture giving shared-tab tests their own tab of the shared browser.
+
+    Tests without ``@pytest.mark.shared_tab``, or runs without ``--tab-multiplex``, get the plain session browser.
+
+    Yields:
+        WebDriver: The shared driver switched to the test's tab when multiplexing, else ``start_browser``.
+    """
+    plugin = request.config.pluginmanager.get_plugin("tab_multiplex_plugin")
+    url = TabMultiplexPlugin.start_url(request.node)
+    if plugin is None or url is None:
+        yield request.getfixturevalue("start_browser")
+        return
+
+    driver = request.getfixturevalue("shared_browser")
+    scheduler = plugin.scheduler_for(driver)
+    handle = scheduler.acquire(request.node.nodeid, url)
+    upcoming = plugin.upcoming(request.node)
+    scheduler.discard_except(item.nodeid for item in upcoming)
+    for item in upcoming:
+        scheduler.prefetch(item.nodeid, plugin.start_url(item))
+    driver.switch_to.window(handle)
+    try:
+        yield driver
+    finally:
+        scheduler.release(handle)
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("tabs", "multi-tab session multiplexing")
+    group.addoption("--tab-multiplex", action="store_true", default=False,
+                    help="Run tests marked shared_tab in their own tab of one browser; xdist workers share one Chrome.")
+
+
+def pytest_configure(config):
+    if config.getoption("tab_multiplex"):
+        config.pluginmanager.register(TabMultiplexPlugin(config), "tab_multiplex_plugin")
@@ -0,0 +1,352 @@
+# utils/web_metrics.py
+"""
+Per-page-transition web performance metrics.
+
+After every page-object transition (the start page, a search, a currency or language switch) one
+asynchronous script call reads Navigation and Resource Timing, paint timings and, through buffered
+``PerformanceObserver``s, Largest Contentful Paint and Cumulative Layout Shift.  The metrics of a test
+are attached to its result as the ``web_metrics`` user property, checked against ``PERF_BUDGETS`` and
+appended to a history file that is summarised into p50/p75/p95 per page type.  Pages loaded while a session
+fixture is set up belong to no test: their budget violations are listed in the terminal summary and fail the run::
+
+    python -m utils.web_metrics summary .metrics/web_metrics.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import pytest
+from selenium.common import TimeoutException, WebDriverException
+from selenium.webdriver.support.wait import WebDriverWait
+
+from utils.config import (PAGE_LOAD_TIME, PERF_BUDGETS, WEB_METRICS_HISTORY_PATH, WEB_METRICS_HISTORY_WINDOW,
+                          WEB_METRICS_SETTLE_MS)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PERCENTILES = (50, 75, 95)
+SUMMARY_METRICS = ("ttfb_ms", "fcp_ms", "lcp_ms", "load_ms", "cls")
+
+_enabled = False
+_pending = []
+_history = []
+_session_violations = []
+
+# Waits for the load event plus a settle delay, then reports every metric of the current document at once.
+_COLLECT_SCRIPT = """
+var done = arguments[arguments.length - 1];
+var settle = arguments[0];
+var state = {lcp: null, cls: 0};
+var handlers = {
+    'largest-contentful-paint': function (entry) { state.lcp = entry.renderTime || entry.startTime; },
+    'layout-shift': function (entry) { if (!entry.hadRecentInput) { state.cls += entry.value; } }
+};
+var observers = [];
+var supported = (window.PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+Object.keys(handlers).forEach(function (type) {
+    if (supported.indexOf(type) === -1) { return; }
+    var observer = new PerformanceObserver(function (list) { list.getEntries().forEach(handlers[type]); });
+    observer.observe({type: type, buffered: true});
+    observers.push([observer, type]);
+});
+function finish() {
+    observers.forEach(function (pair) {
+        pair[0].takeRecords().forEach(handlers[pair[1]]);
+        pair[0].disconnect();
+    });
+    var nav = performance.getEntriesByType('navigation')[0];
+    var paints = {};
+    performance.getEntriesByType('paint').forEach(function (entry) { paints[entry.name] = entry.startTime; });
+    var resources = performance.getEntriesByType('resource');
+    var resourceBytes = 0, slowest = null;
+    resources.forEach(function (entry) {
+        resourceBytes += entry.transferSize || 0;
+        if (!slowest || entry.duration > slowest.duration) { slowest = entry; }
+    });
+    done({
+        url: location.href,
+        ttfb_ms: nav ? nav.responseStart - nav.startTime : null,
+        dom_content_loaded_ms: nav ? nav.domContentLoadedEventEnd - nav.startTime : null,
+        load_ms: nav && nav.loadEventEnd ? nav.loadEventEnd - nav.startTime : null,
+        transfer_bytes: nav ? nav.transferSize : null,
+        fp_ms: paints['first-paint'] === undefined ? null : paints['first-paint'],
+        fcp_ms: paints['first-contentful-paint'] === undefined ? null : paints['first-contentful-paint'],
+        lcp_ms: state.lcp,
+        cls: supported.indexOf('layout-shift') === -1 ? null : state.cls,
+        resources: resources.length,
+        resource_bytes: resourceBytes,
+        slowest_resource_ms: slowest ? slowest.duration : null,
+        slowest_resource: slowest ? slowest.name : null
+    });
+}
+(function waitForLoad() {
+    if (document.readyState === 'complete') { setTimeout(finish, settle); } else { setTimeout(waitForLoad, 50); }
+})();
+"""
+
+_MARK_STALE_SCRIPT = "document.documentElement.setAttribute('data-metrics-stale', '1');"
+_NAVIGATED_SCRIPT = """
+return document.readyState === 'complete' && !document.documentElement.hasAttribute('data-metrics-stale');
+"""
+
+
+def enable(enabled=True):
+    """
+    Switch metric collection on or off for this process (pytest switches it on unless --no-web-metrics is given).
+    """
+    global _enabled
+    _enabled = enabled
+
+
+def _supported(driver):
+    # Browserless drivers have no performance timeline
+    return _enabled and not getattr(driver, "is_static", False)
+
+
+def collect_metrics(driver, settle_ms=WEB_METRICS_SETTLE_MS):
+    """
+    Read the performance metrics of the current document in a single asynchronous script call.
+
+    Returns:
+        dict: Timings in milliseconds (rounded), CLS, byte counts and the slowest resource.
+    """
+    metrics = driver.execute_async_script(_COLLECT_SCRIPT, settle_ms)
+    return {key: round(value, 4 if key == "cls" else 1) if isinstance(value, float) else value
+            for key, value in metrics.items()}
+
+
+def _collect_record(driver, page_type):
+    if not _supported(driver):
+        return None
+    try:
+        metrics = collect_metrics(driver)
+    except WebDriverException as e:
+        logger.error(f"Could not collect web metrics for {page_type}: {e.msg}")
+        return None
+    record = {"page_type": page_type, "time": time.time(), **metrics}
+    logger.info(f"Web metrics for {page_type}: ttfb={record['ttfb_ms']}ms fcp={record['fcp_ms']}ms "
+                f"lcp={record['lcp_ms']}ms cls={record['cls']}")
+    return record
+
+
+def record_page(driver, page_type):
+    """
+    Collect the metrics of the loaded page and queue them for the running test.
+
+    Collection problems are logged and never fail the calling page object.
+
+    Returns:
+        dict or None: The recorded metrics, or None if collection is disabled or failed.
+    """
+    record = _collect_record(driver, page_type)
+    if record is not None:
+        _pending.append(record)
+    return record
+
+
+def record_session_page(driver, page_type, budgets=PERF_BUDGETS):
+    """
+    Collect the metrics of a page loaded by a session fixture, outside of any test.
+
+    The metrics go to the history only; their budget violations are kept for the session summary instead of
+    failing whichever test happens to run first.
+
+    Returns:
+        dict or None: The recorded metrics, or None if collection is disabled or failed.
+    """
+    record = _collect_record(driver, page_type)
+    if record is not None:
+        _history.append(record)
+        _session_violations.extend(check_budgets([record], budgets))
+    return record
+
+
+@contextmanager
+def measure_transition(driver, page_type, timeout=PAGE_LOAD_TIME):
+    """
+    Context manager recording the metrics of the page a page-object action navigates to.
+
+    The current document is marked before the action; afterwards the new document's metrics are collected
+    once it has replaced the marked one and finished loading.
+    """
+    if not _supported(driver):
+        yield
+        return
+    try:
+        driver.execute_script(_MARK_STALE_SCRIPT)
+    except WebDriverException as e:
+        logger.error(f"Could not mark the current page before {page_type}: {e.msg}")
+    yield
+    try:
+        # Scripts fail while the old document unloads, so those errors only mean "not yet"
+        WebDriverWait(driver, timeout=timeout, poll_frequency=0.1, ignored_exceptions=(WebDriverException,)).until(
+            lambda current_driver: current_driver.execute_script(_NAVIGATED_SCRIPT))
+    except TimeoutException:
+        logger.error(f"No navigation to {page_type} within {timeout} seconds; metrics not recorded")
+        return
+    record_page(driver, page_type)
+
+
+def drain():
+    """
+    Return and forget the metrics recorded since the last call.
+    """
+    records = list(_pending)
+    _pending.clear()
+    _history.extend(records)
+    return records
+
+
+def check_budgets(records, budgets=PERF_BUDGETS):
+    """
+    Compare metrics against the budgets of their page type ("*" applies to every page type).
+
+    Returns:
+        list: One message per exceeded budget.
+    """
+    violations = []
+    for record in records:
+        limits = {**budgets.get("*", {}), **budgets.get(record["page_type"], {})}
+        for metric, limit in limits.items():
+            value = record.get(metric)
+            if value is not None and value > limit:
+                violations.append(f"{record['page_type']} {metric}={value} exceeds budget {limit} ({record['url']})")
+    return violations
+
+
+def percentile(values, pct):
+    """
+    Nearest-rank percentile of a non-empty list.
+    """
+    ordered = sorted(values)
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[rank - 1]
+
+
+def summarize(records, window=WEB_METRICS_HISTORY_WINDOW, metrics=SUMMARY_METRICS):
+    """
+    Percentile summary per page type over the most recent records.
+
+    Returns:
+        dict: {page_type: {"samples": n, metric: {"p50": ..., "p75": ..., "p95": ...}}}
+    """
+    by_page = defaultdict(list)
+    for record in records:
+        by_page[record["page_type"]].append(record)
+    summary = {}
+    for page_type, page_records in sorted(by_page.items()):
+        recent = page_records[-window:]
+        summary[page_type] = {"samples": len(recent)}
+        for metric in metrics:
+            values = [record[metric] for record in recent if record.get(metric) is not None]
+            if values:
+                summary[page_type][metric] = {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+    return summary
+
+
+def read_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as history_file:
+        return [json.loads(line) for line in history_file if line.strip()]
+
+
+def append_history(path, records):
+    if not records:
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # One write per record keeps lines from concurrent xdist workers intact
+    with open(path, "a", encoding="utf-8") as history_file:
+        for record in records:
+            history_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def format_summary(summary):
+    lines = []
+    for page_type, stats in summary.items():
+        cells = [f"{metric} {'/'.join(str(stats[metric][f'p{pct}']) for pct in PERCENTILES)}"
+                 for metric in SUMMARY_METRICS if metric in stats]
+        lines.append(f"{page_type} (n={stats['samples']}): {', '.join(cells)}")
+    return lines
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("web-metrics", "web performance metrics")
+    group.addoption("--no-web-metrics", action="store_true", default=False,
+                    help="Do not collect performance metrics after page transitions.")
+    group.addoption("--web-metrics-history", metavar="PATH", default=WEB_METRICS_HISTORY_PATH,
+                    help="JSON Lines file the metrics of every run are appended to.")
+
+
+def pytest_configure(config):
+    enable(not config.getoption("no_web_metrics"))
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    try:
+        result = yield
+    finally:
+        records = drain()
+        for record in records:
+            item.user_properties.append(("web_metrics", record))
+    violations = check_budgets(records)
+    if violations:
+        raise AssertionError("Performance budget exceeded:\n  " + "\n  ".join(violations))
+    return result
+
+
+def pytest_sessionfinish(session):
+    if _enabled and not session.config.pluginmanager.hasplugin("dsession"):
+        drain()
+        append_history(session.config.getoption("web_metrics_history"), _history)
+    workeroutput = getattr(session.config, "workeroutput", None)
+    if workeroutput is not None:
+        workeroutput["web_metrics_violations"] = list(_session_violations)
+    elif _session_violations and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    _session_violations.extend(getattr(node, "workeroutput", {}).get("web_metrics_violations", []))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not _enabled:
+        return
+    if _session_violations:
+        terminalreporter.section("performance budget exceeded during session setup", red=True)
+        for violation in _session_violations:
+            terminalreporter.write_line(violation)
+    summary = summarize(read_history(config.getoption("web_metrics_history")))
+    if not summary:
+        return
+    terminalreporter.section("web metrics (p50/p75/p95)")
+    for line in format_summary(summary):
+        terminalreporter.write_line(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m utils.web_metrics")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    summary_parser = subparsers.add_parser("summary", help="Summarise the metric history per page type.")
+    summary_parser.add_argument("path", nargs="?", default=WEB_METRICS_HISTORY_PATH, help="Metric history file.")
+    summary_parser.add_argument("--window", type=int, default=WEB_METRICS_HISTORY_WINDOW,
+                                help="Number of most recent samples per page type.")
+    args = parser.parse_args(argv)
+
+    json.dump(summarize(read_history(args.path), window=args.window), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())